@@ -14,6 +14,7 @@ from selenium.webdriver import ActionChains
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 import functools
+from collections import namedtuple
 
 
 # ============================================================================
@@ -97,7 +98,7 @@ def save_file_to_output(file_path, output_folder):
         if file_path and os.path.exists(file_path):
             filename = os.path.basename(file_path)
             output_path = os.path.join(output_folder, filename)
-            shutil.move(file_path, output_path)
+            os.replace(file_path, output_path)
             return output_path
         return file_path
     except Exception as e:
@@ -534,13 +535,15 @@ def process_voltage_overview_database_calculations(raw_df, nrm_df, date_info):
 # ============================================================================
 # COMPARISON
 # ============================================================================
+SheetResult = namedtuple('SheetResult', 'items matches')
+
+
 @log_execution_time
-def create_voltage_overview_comparison(chart_file, processed_file, date_info):
+def create_voltage_overview_comparison(chart_file, processed_file, date_info, output_folder):
     try:
-        output_file = f"validation_report_voltage_overview_{date_info['selected_date'].replace(' ', '_')}.xlsx"
+        output_file = os.path.join(output_folder,
+                                   f"validation_report_voltage_overview_{date_info['selected_date'].replace(' ', '_')}.xlsx")
         sheet_names = ['Voltage Phasewise', 'Voltage at Max Load', 'Voltage Unbalance', 'Voltage Variation']
-        chart_data = {s: pd.read_excel(chart_file, sheet_name=s) for s in sheet_names}
-        processed_data = {s: pd.read_excel(processed_file, sheet_name=s) for s in sheet_names}
 
         green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
         red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
@@ -549,113 +552,113 @@ def create_voltage_overview_comparison(chart_file, processed_file, date_info):
         wb.remove(wb.active)
         validation_results = {}
 
-        for sheet in sheet_names:
-            processed_df = processed_data[sheet]
-            chart_df = chart_data[sheet]
-            ws = wb.create_sheet(title=f"{sheet}_Comparison")
-
-            if sheet == "Voltage Phasewise":
-                headers = ["Phase", "DB_Max", "Chart_Max", "Max_Diff", "Max_Match", "DB_Avg", "Chart_Avg", "Avg_Diff",
-                           "Avg_Match", "Overall"]
-            elif sheet == "Voltage at Max Load":
-                headers = ["Phase", "DB_V", "Chart_V", "V_Diff", "V_Match", "DB_Time", "Chart_Time", "Time_Match",
-                           "Overall"]
-            elif sheet == "Voltage Unbalance":
-                headers = ["Phase", "DB_Unb", "Chart_Unb", "Unb_Diff", "Overall"]
-            else:
-                headers = ["Range", "DB_Dur", "Chart_Dur", "Dur_Match", "Overall"]
-
-            ws.append(headers)
-            sheet_results = []
-
-            for i in range(len(processed_df)):
-                row_data = []
-                overall_match = True
+        with pd.ExcelFile(chart_file) as chart_xl, pd.ExcelFile(processed_file) as processed_xl:
+            for sheet in sheet_names:
+                processed_df = processed_xl.parse(sheet)
+                chart_df = chart_xl.parse(sheet)
+                ws = wb.create_sheet(title=f"{sheet}_Comparison")
 
                 if sheet == "Voltage Phasewise":
-                    phase = processed_df.iloc[i, 0]
-                    row_data.append(phase)
-                    db_max, chart_max = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
-                    try:
-                        max_diff = abs(float(db_max) - float(chart_max)) if db_max != "-" and chart_max != "-" else "-"
-                        max_match = "YES" if (max_diff != "-" and max_diff <= 0.1) or str(db_max).strip() == str(
-                            chart_max).strip() else "NO"
-                    except:
-                        max_diff, max_match = "-", "YES" if str(db_max).strip() == str(chart_max).strip() else "NO"
-                    overall_match = overall_match and (max_match == "YES")
-                    row_data.extend([db_max, chart_max, max_diff, max_match])
-
-                    db_avg, chart_avg = processed_df.iloc[i, 2], chart_df.iloc[i, 2] if i < len(chart_df) else "-"
-                    try:
-                        avg_diff = abs(float(db_avg) - float(chart_avg)) if db_avg != "-" and chart_avg != "-" else "-"
-                        avg_match = "YES" if (avg_diff != "-" and avg_diff <= 0.1) or str(db_avg).strip() == str(
-                            chart_avg).strip() else "NO"
-                    except:
-                        avg_diff, avg_match = "-", "YES" if str(db_avg).strip() == str(chart_avg).strip() else "NO"
-                    overall_match = overall_match and (avg_match == "YES")
-                    row_data.extend([db_avg, chart_avg, avg_diff, avg_match, "YES" if overall_match else "NO"])
-
+                    headers = ["Phase", "DB_Max", "Chart_Max", "Max_Diff", "Max_Match", "DB_Avg", "Chart_Avg", "Avg_Diff",
+                               "Avg_Match", "Overall"]
                 elif sheet == "Voltage at Max Load":
-                    phase = processed_df.iloc[i, 0]
-                    row_data.append(phase)
-                    db_v, chart_v = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
-                    try:
-                        v_diff = abs(float(db_v) - float(chart_v)) if db_v != "-" and chart_v != "-" else "-"
-                        v_match = "YES" if (v_diff != "-" and v_diff <= 0.1) or str(db_v).strip() == str(
-                            chart_v).strip() else "NO"
-                    except:
-                        v_diff, v_match = "-", "YES" if str(db_v).strip() == str(chart_v).strip() else "NO"
-                    overall_match = overall_match and (v_match == "YES")
-                    row_data.extend([db_v, chart_v, v_diff, v_match])
-
-                    db_time, chart_time = processed_df.iloc[i, 2], chart_df.iloc[i, 2] if i < len(chart_df) else "-"
-                    time_match = "YES" if str(db_time).strip() == str(chart_time).strip() else "NO"
-                    overall_match = overall_match and (time_match == "YES")
-                    row_data.extend([db_time, chart_time, time_match, "YES" if overall_match else "NO"])
-
+                    headers = ["Phase", "DB_V", "Chart_V", "V_Diff", "V_Match", "DB_Time", "Chart_Time", "Time_Match",
+                               "Overall"]
                 elif sheet == "Voltage Unbalance":
-                    phase = processed_df.iloc[i, 0]
-                    row_data.append(phase)
-                    db_unb, chart_unb = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
-                    try:
-                        unb_diff = round(abs(float(db_unb) - float(chart_unb)),
-                                         2) if db_unb != "-" and chart_unb != "-" else "-"
-                        overall_match = "YES" if (unb_diff != "-" and unb_diff <= 0.1) or str(db_unb).strip() == str(
-                            chart_unb).strip() else "NO"
-                    except:
-                        unb_diff, overall_match = "-", "YES" if str(db_unb).strip() == str(chart_unb).strip() else "NO"
-                    row_data.extend([db_unb, chart_unb, unb_diff, overall_match])
-
-                else:  # Voltage Variation
-                    v_range = processed_df.iloc[i, 0]
-                    row_data.append(v_range)
-                    db_dur, chart_dur = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
-                    dur_match = "YES" if str(db_dur).strip() == str(chart_dur).strip() else "NO"
-                    overall_match = dur_match == "YES"
-                    row_data.extend([db_dur, chart_dur, dur_match, overall_match])
-
-                sheet_results.append({'item': phase if sheet != "Voltage Variation" else v_range,
-                                      'match': overall_match == "YES" if isinstance(overall_match,
-                                                                                    str) else overall_match})
-                ws.append(row_data)
-
-            validation_results[sheet] = sheet_results
-
-            # Apply colors
-            for row_num in range(2, ws.max_row + 1):
-                for col_num in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row_num, column=col_num)
-                    header = ws.cell(row=1, column=col_num).value
-                    if header and ("Match" in header or header == "Overall"):
-                        if cell.value == "YES":
-                            cell.fill = green_fill
-                        elif cell.value == "NO":
-                            cell.fill = red_fill
-                    elif header and "Diff" in header:
-                        if isinstance(cell.value, (int, float)) and cell.value <= 0.1:
-                            cell.fill = green_fill
-                        elif isinstance(cell.value, (int, float)):
-                            cell.fill = red_fill
+                    headers = ["Phase", "DB_Unb", "Chart_Unb", "Unb_Diff", "Overall"]
+                else:
+                    headers = ["Range", "DB_Dur", "Chart_Dur", "Dur_Match", "Overall"]
+
+                ws.append(headers)
+                sheet_items, sheet_matches = [], []
+
+                for i in range(len(processed_df)):
+                    row_data = []
+                    overall_match = True
+
+                    if sheet == "Voltage Phasewise":
+                        phase = processed_df.iloc[i, 0]
+                        row_data.append(phase)
+                        db_max, chart_max = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
+                        try:
+                            max_diff = abs(float(db_max) - float(chart_max)) if db_max != "-" and chart_max != "-" else "-"
+                            max_match = "YES" if (max_diff != "-" and max_diff <= 0.1) or str(db_max).strip() == str(
+                                chart_max).strip() else "NO"
+                        except:
+                            max_diff, max_match = "-", "YES" if str(db_max).strip() == str(chart_max).strip() else "NO"
+                        overall_match = overall_match and (max_match == "YES")
+                        row_data.extend([db_max, chart_max, max_diff, max_match])
+
+                        db_avg, chart_avg = processed_df.iloc[i, 2], chart_df.iloc[i, 2] if i < len(chart_df) else "-"
+                        try:
+                            avg_diff = abs(float(db_avg) - float(chart_avg)) if db_avg != "-" and chart_avg != "-" else "-"
+                            avg_match = "YES" if (avg_diff != "-" and avg_diff <= 0.1) or str(db_avg).strip() == str(
+                                chart_avg).strip() else "NO"
+                        except:
+                            avg_diff, avg_match = "-", "YES" if str(db_avg).strip() == str(chart_avg).strip() else "NO"
+                        overall_match = overall_match and (avg_match == "YES")
+                        row_data.extend([db_avg, chart_avg, avg_diff, avg_match, "YES" if overall_match else "NO"])
+
+                    elif sheet == "Voltage at Max Load":
+                        phase = processed_df.iloc[i, 0]
+                        row_data.append(phase)
+                        db_v, chart_v = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
+                        try:
+                            v_diff = abs(float(db_v) - float(chart_v)) if db_v != "-" and chart_v != "-" else "-"
+                            v_match = "YES" if (v_diff != "-" and v_diff <= 0.1) or str(db_v).strip() == str(
+                                chart_v).strip() else "NO"
+                        except:
+                            v_diff, v_match = "-", "YES" if str(db_v).strip() == str(chart_v).strip() else "NO"
+                        overall_match = overall_match and (v_match == "YES")
+                        row_data.extend([db_v, chart_v, v_diff, v_match])
+
+                        db_time, chart_time = processed_df.iloc[i, 2], chart_df.iloc[i, 2] if i < len(chart_df) else "-"
+                        time_match = "YES" if str(db_time).strip() == str(chart_time).strip() else "NO"
+                        overall_match = overall_match and (time_match == "YES")
+                        row_data.extend([db_time, chart_time, time_match, "YES" if overall_match else "NO"])
+
+                    elif sheet == "Voltage Unbalance":
+                        phase = processed_df.iloc[i, 0]
+                        row_data.append(phase)
+                        db_unb, chart_unb = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
+                        try:
+                            unb_diff = round(abs(float(db_unb) - float(chart_unb)),
+                                             2) if db_unb != "-" and chart_unb != "-" else "-"
+                            overall_match = "YES" if (unb_diff != "-" and unb_diff <= 0.1) or str(db_unb).strip() == str(
+                                chart_unb).strip() else "NO"
+                        except:
+                            unb_diff, overall_match = "-", "YES" if str(db_unb).strip() == str(chart_unb).strip() else "NO"
+                        row_data.extend([db_unb, chart_unb, unb_diff, overall_match])
+
+                    else:  # Voltage Variation
+                        v_range = processed_df.iloc[i, 0]
+                        row_data.append(v_range)
+                        db_dur, chart_dur = processed_df.iloc[i, 1], chart_df.iloc[i, 1] if i < len(chart_df) else "-"
+                        dur_match = "YES" if str(db_dur).strip() == str(chart_dur).strip() else "NO"
+                        overall_match = dur_match == "YES"
+                        row_data.extend([db_dur, chart_dur, dur_match, overall_match])
+
+                    sheet_items.append(phase if sheet != "Voltage Variation" else v_range)
+                    sheet_matches.append(overall_match == "YES" if isinstance(overall_match, str) else overall_match)
+                    ws.append(row_data)
+
+                validation_results[sheet] = SheetResult(sheet_items, sheet_matches)
+
+                # Apply colors
+                for row_num in range(2, ws.max_row + 1):
+                    for col_num in range(1, ws.max_column + 1):
+                        cell = ws.cell(row=row_num, column=col_num)
+                        header = ws.cell(row=1, column=col_num).value
+                        if header and ("Match" in header or header == "Overall"):
+                            if cell.value == "YES":
+                                cell.fill = green_fill
+                            elif cell.value == "NO":
+                                cell.fill = red_fill
+                        elif header and "Diff" in header:
+                            if isinstance(cell.value, (int, float)) and cell.value <= 0.1:
+                                cell.fill = green_fill
+                            elif isinstance(cell.value, (int, float)):
+                                cell.fill = red_fill
 
         wb.save(output_file)
         logger.info(f"Comparison saved: {output_file}")
@@ -668,14 +671,23 @@ def create_voltage_overview_comparison(chart_file, processed_file, date_info):
 # ============================================================================
 # SUMMARY REPORT - COMPLETE VERSION
 # ============================================================================
+# Shared style objects reused across summary cells
+_CENTER = Alignment(horizontal="center", vertical="center")
+_HCENTER = Alignment(horizontal="center")
+_TIMESTAMP_FONT = Font(size=10, italic=True, color="666666")
+_RATE_FONT = Font(bold=True, size=10)
+_WARNING_FONT = Font(bold=True, size=10, color="000000")
+_SUCCESS_RATE_FONT = Font(bold=True, size=11)
+
+
 @log_execution_time
 def create_voltage_overview_summary_report(config, date_info, chart_file, processed_file, comparison_file,
-                                           validation_results, raw_df, meter_name):
+                                           validation_results, raw_df, meter_name, output_folder):
     """Create comprehensive voltage overview summary report"""
     try:
         date_safe = date_info['selected_date'].replace(' ', '_')
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        summary_file = f"SUMMARY_VOLTAGE_OVERVIEW_{date_safe}_{timestamp}.xlsx"
+        summary_file = os.path.join(output_folder, f"SUMMARY_VOLTAGE_OVERVIEW_{date_safe}_{timestamp}.xlsx")
 
         wb = Workbook()
         ws = wb.active
@@ -709,7 +721,7 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
         cell.value = f"LV VOLTAGE OVERVIEW VALIDATION - {date_info['selected_date'].upper()}"
         cell.font = main_header_font
         cell.fill = main_header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.alignment = _CENTER
         cell.border = thick_border
         ws.row_dimensions[row].height = 30
         row += 1
@@ -718,8 +730,8 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
         ws.merge_cells(f'A{row}:H{row}')
         cell = ws[f'A{row}']
         cell.value = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        cell.font = Font(size=10, italic=True, color="666666")
-        cell.alignment = Alignment(horizontal="center")
+        cell.font = _TIMESTAMP_FONT
+        cell.alignment = _HCENTER
         cell.border = thin_border
         row += 2
 
@@ -797,11 +809,11 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
             ws[f'B{row}'].value = count
             ws[f'B{row}'].font = data_font
             ws[f'B{row}'].border = thin_border
-            ws[f'B{row}'].alignment = Alignment(horizontal="center")
+            ws[f'B{row}'].alignment = _HCENTER
             ws[f'C{row}'].value = status
             ws[f'C{row}'].font = pass_font if "COMPLETE" in status else fail_font
             ws[f'C{row}'].fill = pass_fill if "COMPLETE" in status else fail_fill
-            ws[f'C{row}'].alignment = Alignment(horizontal="center")
+            ws[f'C{row}'].alignment = _HCENTER
             ws[f'C{row}'].border = thin_border
             row += 1
         row += 1
@@ -827,8 +839,8 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
 
         overall_pass = overall_total = 0
         for sheet_name, results in validation_results.items():
-            total = len(results)
-            passed = sum(1 for r in results if r['match'])
+            total = len(results.matches)
+            passed = sum(results.matches)
             failed = total - passed
             rate = f"{(passed / total * 100):.1f}%" if total > 0 else "0%"
             status = "PASS" if passed == total else "FAIL"
@@ -841,19 +853,19 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
             ws[f'B{row}'].value = passed
             ws[f'B{row}'].font = data_font
             ws[f'B{row}'].border = thin_border
-            ws[f'B{row}'].alignment = Alignment(horizontal="center")
+            ws[f'B{row}'].alignment = _HCENTER
             ws[f'C{row}'].value = failed
             ws[f'C{row}'].font = data_font
             ws[f'C{row}'].border = thin_border
-            ws[f'C{row}'].alignment = Alignment(horizontal="center")
+            ws[f'C{row}'].alignment = _HCENTER
             ws[f'D{row}'].value = rate
-            ws[f'D{row}'].font = Font(bold=True, size=10)
+            ws[f'D{row}'].font = _RATE_FONT
             ws[f'D{row}'].border = thin_border
-            ws[f'D{row}'].alignment = Alignment(horizontal="center")
+            ws[f'D{row}'].alignment = _HCENTER
             ws[f'E{row}'].value = status
             ws[f'E{row}'].font = pass_font if status == "PASS" else fail_font
             ws[f'E{row}'].fill = pass_fill if status == "PASS" else fail_fill
-            ws[f'E{row}'].alignment = Alignment(horizontal="center")
+            ws[f'E{row}'].alignment = _HCENTER
             ws[f'E{row}'].border = thin_border
             row += 1
         row += 1
@@ -877,7 +889,7 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
         elif success_rate >= 80:
             assessment = "⚠ GOOD: Minor issues found"
             color = warning_fill
-            font_color = Font(bold=True, size=10, color="000000")
+            font_color = _WARNING_FONT
         else:
             assessment = "❌ ATTENTION: Significant failures"
             color = fail_fill
@@ -888,7 +900,7 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
         cell.value = assessment
         cell.font = font_color
         cell.fill = color
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.alignment = _CENTER
         cell.border = thick_border
         for c in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
             ws[f'{c}{row}'].border = thick_border
@@ -898,9 +910,9 @@ def create_voltage_overview_summary_report(config, date_info, chart_file, proces
         ws.merge_cells(f'A{row}:H{row}')
         cell = ws[f'A{row}']
         cell.value = f"Success Rate: {success_rate:.1f}% ({overall_pass}/{overall_total} validations passed)"
-        cell.font = Font(bold=True, size=11)
+        cell.font = _SUCCESS_RATE_FONT
         cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
+        cell.alignment = _HCENTER
         cell.border = thin_border
         for c in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
             ws[f'{c}{row}'].border = thin_border
@@ -983,12 +995,12 @@ def main_lv_voltage_overview_automation():
         processed_file = process_voltage_overview_database_calculations(raw_df, nrm_df, date_info)
         processed_file = save_file_to_output(processed_file, output_folder)
 
-        comparison_file, validation_results = create_voltage_overview_comparison(chart_file, processed_file, date_info)
-        comparison_file = save_file_to_output(comparison_file, output_folder)
+        comparison_file, validation_results = create_voltage_overview_comparison(chart_file, processed_file,
+                                                                                 date_info, output_folder)
 
         summary_report = create_voltage_overview_summary_report(config, date_info, chart_file, processed_file,
-                                                                comparison_file, validation_results, raw_df, name)
-        summary_report = save_file_to_output(summary_report, output_folder)
+                                                                comparison_file, validation_results, raw_df, name,
+                                                                output_folder)
 
         logger.info("=" * 60)
         logger.info("LV VOLTAGE OVERVIEW AUTOMATION COMPLETED!")
@@ -1,19 +1,32 @@
 import os
+import io
 import shutil
 import time
 import logging
 import pandas as pd
 import numpy as np
-import psycopg2
-from datetime import datetime, timedelta
+import threading
+import atexit
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.pool import ThreadedConnectionPool
+from datetime import datetime, date, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.xml import LXML
 import functools
 import re
+import types
+import calendar
 
 
 # ============================================================================
@@ -103,6 +116,12 @@ def setup_logger():
 
 logger = setup_logger()
 
+# openpyxl serializes workbooks through lxml when it is installed - without it every save falls
+# back to the much slower pure-Python XML writer
+if not LXML:
+    logger.warning("lxml is not installed - Excel reports will be written with the slower XML serializer "
+                   "(pip install lxml)")
+
 
 # ============================================================================
 # OUTPUT FOLDER MANAGEMENT
@@ -142,13 +161,13 @@ def log_execution_time(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
-        logger.info(f"Starting {func.__name__}...")
+        logger.info("Starting %s...", func.__name__)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"{func.__name__} completed in {time.time() - start_time:.2f}s")
+            logger.info("%s completed in %.2fs", func.__name__, time.time() - start_time)
             return result
         except Exception as e:
-            logger.info(f"{func.__name__} failed: {e}")
+            logger.info("%s failed: %s", func.__name__, e)
             raise
 
     return wrapper
@@ -165,39 +184,41 @@ def create_default_config_file(config_file):
             'Value': ['YOUR_AREA_HERE', 'YOUR_SUBSTATION_HERE', 'YOUR_FEEDER_HERE', 'January 2025', 'YOUR_METER_NO',
                       'DT']
         }
-        df_config = pd.DataFrame(config_data)
-
-        with pd.ExcelWriter(config_file, engine='openpyxl') as writer:
-            df_config.to_excel(writer, sheet_name='User_Configuration', index=False)
-
-            instructions = {
-                'Step': ['1', '2', '3', '4', '5', '6', '7'],
-                'Instructions': [
-                    'Open the "User_Configuration" sheet',
-                    'Replace "YOUR_AREA_HERE" with your actual area name',
-                    'Replace "YOUR_SUBSTATION_HERE" with your actual substation name',
-                    'Replace "YOUR_FEEDER_HERE" with your actual feeder name',
-                    'Update Target_Month_Year with desired month (e.g., January 2025)',
-                    'Update Meter_Serial_No with your meter serial number',
-                    'Set Meter_Type (DT or LV)',
-                ],
-                'Important_Notes': [
-                    'This script is FOR LV MONTHLY DEMAND SIDE PANEL ONLY (NO GRAPH)',
-                    'Values are case-sensitive',
-                    'No extra spaces before/after values',
-                    'Month format: January 2025',
-                    'Meter_Type: DT or LV only',
-                    'Save file before running',
-                    'Test Engineer: Sanyam Upadhyay',
-                ]
-            }
-            df_instructions = pd.DataFrame(instructions)
-            df_instructions.to_excel(writer, sheet_name='Setup_Instructions', index=False)
-
-        logger.info(f"LV Monthly Demand Side Panel Configuration template created: {config_file}")
+        instructions = {
+            'Step': ['1', '2', '3', '4', '5', '6', '7'],
+            'Instructions': [
+                'Open the "User_Configuration" sheet',
+                'Replace "YOUR_AREA_HERE" with your actual area name',
+                'Replace "YOUR_SUBSTATION_HERE" with your actual substation name',
+                'Replace "YOUR_FEEDER_HERE" with your actual feeder name',
+                'Update Target_Month_Year with desired month (e.g., January 2025)',
+                'Update Meter_Serial_No with your meter serial number',
+                'Set Meter_Type (DT or LV)',
+            ],
+            'Important_Notes': [
+                'This script is FOR LV MONTHLY DEMAND SIDE PANEL ONLY (NO GRAPH)',
+                'Values are case-sensitive',
+                'No extra spaces before/after values',
+                'Month format: January 2025',
+                'Meter_Type: DT or LV only',
+                'Save file before running',
+                'Test Engineer: Sanyam Upadhyay',
+            ]
+        }
+
+        # Constant rows only - stream them instead of going through DataFrames/ExcelWriter
+        wb = Workbook(write_only=True)
+        for sheet_name, columns in (('User_Configuration', config_data), ('Setup_Instructions', instructions)):
+            ws = wb.create_sheet(sheet_name)
+            ws.append(list(columns))
+            for row in zip(*columns.values()):
+                ws.append(list(row))
+        wb.save(config_file)
+
+        logger.info("LV Monthly Demand Side Panel Configuration template created: %s", config_file)
         return True
     except Exception as e:
-        logger.info(f"Error creating config file: {e}")
+        logger.info("Error creating config file: %s", e)
         return False
 
 
@@ -205,57 +226,75 @@ def normalize_month_year(value):
     """Ensure month-year is in 'Month YYYY' format"""
     if isinstance(value, (pd.Timestamp, datetime)):
         return value.strftime("%B %Y")
+    text = str(value).strip()
     try:
-        parsed = pd.to_datetime(value, errors='raise')
+        # Fast path for the template format ("January 2025")
+        return datetime.strptime(text, "%B %Y").strftime("%B %Y")
+    except ValueError:
+        pass
+    try:
+        parsed = pd.to_datetime(text, errors='raise')
         return parsed.strftime("%B %Y")
     except Exception:
-        return str(value).strip()
+        return text
+
+
+# Excel 'Parameter' name -> config key
+CONFIG_PARAMETER_KEYS = {
+    'Area': 'area',
+    'Substation': 'substation',
+    'Feeder': 'feeder',
+    'Target_Month_Year': 'target_month_year',
+    'Meter_Serial_No': 'meter_serial_no',
+    'Meter_Type': 'meter_type'
+}
 
 
 def read_user_configuration(config_file="user_config.xlsx"):
     """Read user configuration from Excel file for LV Monthly Demand Side Panel"""
+    if not os.path.exists(config_file):
+        logger.info("Configuration file not found: %s", config_file)
+        return None
     try:
-        if not os.path.exists(config_file):
-            logger.info(f"Configuration file not found: {config_file}")
-            return None
-
-        df_config = pd.read_excel(config_file, sheet_name='User_Configuration')
-        config = {'type': 'LV_MONTHLY_SIDEPANEL'}  # Fixed for LV Monthly Side Panel
-
-        for _, row in df_config.iterrows():
-            param, value = row['Parameter'], row['Value']
-            if param == 'Area':
-                config['area'] = str(value).strip()
-            elif param == 'Substation':
-                config['substation'] = str(value).strip()
-            elif param == 'Feeder':
-                config['feeder'] = str(value).strip()
-            elif param == 'Target_Month_Year':
-                config['target_month_year'] = normalize_month_year(value)
-            elif param == 'Meter_Serial_No':
-                config['meter_serial_no'] = str(value).strip()
-            elif param == 'Meter_Type':
-                config['meter_type'] = str(value).strip()
-
-        required_fields = ['type', 'area', 'substation', 'feeder', 'target_month_year', 'meter_serial_no',
-                           'meter_type']
-        missing_fields = [f for f in required_fields if f not in config or not config[f]]
-        if missing_fields:
-            logger.info(f"Missing required configuration: {missing_fields}")
-            return None
+        return _read_user_configuration_cached(config_file, os.path.getmtime(config_file))
+    except Exception as e:
+        # Errors are raised out of the cached parser so a transient read failure is never memoized
+        logger.info("Error reading configuration file: %s", e)
+        return None
 
-        placeholders = ['YOUR_AREA_HERE', 'YOUR_SUBSTATION_HERE', 'YOUR_FEEDER_HERE', 'YOUR_METER_NO']
-        for key, value in config.items():
-            if value in placeholders:
-                logger.info(f"Placeholder value found: {key} = {value}")
-                return None
 
-        logger.info("LV Monthly Demand Side Panel Configuration loaded successfully")
-        return config
-    except Exception as e:
-        logger.info(f"Error reading configuration file: {e}")
+@functools.lru_cache(maxsize=4)
+def _read_user_configuration_cached(config_file, mtime):
+    """Parse the configuration file once per (path, mtime) - returns a read-only mapping"""
+    wb = load_workbook(config_file, read_only=True, data_only=True)
+    try:
+        rows = wb['User_Configuration'].iter_rows(min_row=2, max_col=2, values_only=True)
+        raw = {str(param).strip(): value for param, value in rows if param}
+    finally:
+        wb.close()
+    config = {'type': 'LV_MONTHLY_SIDEPANEL'}  # Fixed for LV Monthly Side Panel
+
+    for param, key in CONFIG_PARAMETER_KEYS.items():
+        if param in raw:
+            value = raw[param]
+            config[key] = normalize_month_year(value) if key == 'target_month_year' else str(value).strip()
+
+    required_fields = ['type', 'area', 'substation', 'feeder', 'target_month_year', 'meter_serial_no',
+                       'meter_type']
+    missing_fields = [f for f in required_fields if f not in config or not config[f]]
+    if missing_fields:
+        logger.info("Missing required configuration: %s", missing_fields)
         return None
 
+    placeholders = ['YOUR_AREA_HERE', 'YOUR_SUBSTATION_HERE', 'YOUR_FEEDER_HERE', 'YOUR_METER_NO']
+    for key, value in config.items():
+        if value in placeholders:
+            logger.info("Placeholder value found: %s = %s", key, value)
+            return None
+
+    logger.info("LV Monthly Demand Side Panel Configuration loaded successfully")
+    return types.MappingProxyType(config)
+
 
 def validate_config_at_startup():
     """Validate configuration before starting browser"""
@@ -265,10 +304,10 @@ def validate_config_at_startup():
 
     config_file = "user_config.xlsx"
     if not os.path.exists(config_file):
-        logger.info(f"Configuration file not found: {config_file}")
+        logger.info("Configuration file not found: %s", config_file)
         logger.info("Creating default LV Monthly Demand Side Panel configuration template...")
         if create_default_config_file(config_file):
-            logger.info(f"Created: {config_file}")
+            logger.info("Created: %s", config_file)
             logger.info("Please edit the configuration file and restart")
         return None
 
@@ -278,218 +317,339 @@ def validate_config_at_startup():
         return None
 
     logger.info("LV Monthly Demand Side Panel Configuration validated successfully")
-    logger.info(f"   Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
-    logger.info(f"   Area: {config['area']}")
-    logger.info(f"   Substation: {config['substation']}")
-    logger.info(f"   Feeder: {config['feeder']}")
-    logger.info(f"   Month: {config['target_month_year']}")
-    logger.info(f"   Meter: {config['meter_serial_no']}")
-    logger.info(f"   Meter Type: {config['meter_type']}")
+    logger.info("   Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
+    logger.info("   Area: %s", config['area'])
+    logger.info("   Substation: %s", config['substation'])
+    logger.info("   Feeder: %s", config['feeder'])
+    logger.info("   Month: %s", config['target_month_year'])
+    logger.info("   Meter: %s", config['meter_serial_no'])
+    logger.info("   Meter Type: %s", config['meter_type'])
     return config
 
 
+# ============================================================================
+# DATABASE CONNECTION POOL
+# ============================================================================
+_DB_POOLS = {}
+_DB_POOL_LOCK = threading.Lock()
+
+# Meter lookups used by get_metrics - prepared once per DB1 connection, executed with EXECUTE
+METRICS_PREPARED_STATEMENTS = (
+    f"PREPARE meter_lookup_dt AS SELECT dt_id, dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_dt "
+    f"WHERE meter_serial_no = $1 LIMIT 1",
+    f"PREPARE meter_lookup_lv AS SELECT dt_id, lvfeeder_name AS dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_lvfeeder "
+    f"WHERE meter_serial_no = $1 LIMIT 1",
+    f"PREPARE sip_lookup AS SELECT sip FROM {DatabaseConfig.TENANT_NAME}.tb_metermasterdetail WHERE mtrid = $1 LIMIT 1",
+)
+
+
+class PreparedStatementPool(ThreadedConnectionPool):
+    """ThreadedConnectionPool that runs PREPARE statements on every new connection"""
+
+    def __init__(self, minconn, maxconn, prepared_statements=(), **kwargs):
+        self.prepared_statements = prepared_statements  # Must exist before the base class opens minconn
+        super().__init__(minconn, maxconn, **kwargs)
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        if self.prepared_statements:
+            with conn.cursor() as cursor:
+                for statement in self.prepared_statements:
+                    cursor.execute(statement)
+            conn.commit()
+        return conn
+
+
+def get_db_pool(db_name):
+    """Return the shared connection pool for 'db1' or 'db2', creating it on first use"""
+    with _DB_POOL_LOCK:
+        pool = _DB_POOLS.get(db_name)
+        if pool is None:
+            if db_name == 'db1':
+                pool = PreparedStatementPool(minconn=1, maxconn=8, prepared_statements=METRICS_PREPARED_STATEMENTS,
+                                             **DatabaseConfig.get_db1_params())
+            else:
+                pool = ThreadedConnectionPool(minconn=1, maxconn=8, **DatabaseConfig.get_db2_params())
+            _DB_POOLS[db_name] = pool
+        return pool
+
+
+@contextmanager
+def db_conn(db_name):
+    """Borrow a pooled connection and always hand it back to the pool"""
+    pool = get_db_pool(db_name)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def close_db_pools():
+    """Close every pooled connection (registered to run at interpreter exit)"""
+    with _DB_POOL_LOCK:
+        for pool in _DB_POOLS.values():
+            pool.closeall()
+        _DB_POOLS.clear()
+
+
+atexit.register(close_db_pools)
+
+
+def read_sql_copy(conn, query, params=None, dtype=None):
+    """Stream a SELECT through COPY ... TO STDOUT as CSV and parse it with pandas"""
+    buffer = io.StringIO()
+    with conn.cursor() as cursor:
+        if params is not None:
+            # COPY does not accept bind parameters - let psycopg2 quote them client-side
+            query = cursor.mogrify(query, params).decode()
+        cursor.copy_expert(f"COPY ({query.strip().rstrip(';')}) TO STDOUT WITH CSV HEADER", buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, parse_dates=['surveydate'], dtype=dtype)
+
+
+def read_sql_copy_pooled(db_name, query, params=None, dtype=None):
+    """Run read_sql_copy on its own pooled connection so fetches can overlap"""
+    with db_conn(db_name) as conn:
+        return read_sql_copy(conn, query, params, dtype)
+
+
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
 @log_execution_time
 def get_metrics(mtr_serial_no, meter_type):
     """Get meter metrics from database including SIP duration - EXACT same as daywise"""
-    logger.info(f"Fetching LV Monthly metrics for meter: {mtr_serial_no}")
+    logger.info("Fetching LV Monthly metrics for meter: %s", mtr_serial_no)
     try:
-        conn = psycopg2.connect(**DatabaseConfig.get_db1_params())
-        cursor = conn.cursor()
+        return _get_metrics_cached(mtr_serial_no, meter_type.upper())
+    except Exception as e:
+        # Errors are raised out of the cached helper so a transient failure is never memoized
+        logger.info("Database error: %s", e)
+        return None, None, None, None, None
 
-        if meter_type.upper() == 'DT':
-            query1 = f"SELECT dt_id, dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_dt WHERE meter_serial_no = %s LIMIT 1;"
-        elif meter_type.upper() == 'LV':
-            query1 = f"SELECT dt_id, lvfeeder_name AS dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_lvfeeder WHERE meter_serial_no = %s LIMIT 1;"
-        else:
-            logger.info(f"Invalid meter type: {meter_type}")
-            return None, None, None, None, None
 
+@functools.lru_cache(maxsize=128)
+def _get_metrics_cached(mtr_serial_no, meter_type):
+    """Meter lookup behind get_metrics - one DB round-trip pair per (serial, type) per run"""
+    if meter_type == 'DT':
+        query1 = "EXECUTE meter_lookup_dt (%s);"
+    elif meter_type == 'LV':
+        query1 = "EXECUTE meter_lookup_lv (%s);"
+    else:
+        logger.info("Invalid meter type: %s", meter_type)
+        return None, None, None, None, None
+
+    with db_conn('db1') as conn:
+        cursor = conn.cursor()
         cursor.execute(query1, (mtr_serial_no,))
         result1 = cursor.fetchone()
         if not result1:
-            logger.info(f"Meter not found: {mtr_serial_no}")
+            logger.info("Meter not found: %s", mtr_serial_no)
             return None, None, None, None, None
 
         dt_id, dt_name, meterid = result1
         node_id = dt_id  # node_id is same as dt_id
 
         # Get SIP duration
-        query2 = f"SELECT sip FROM {DatabaseConfig.TENANT_NAME}.tb_metermasterdetail WHERE mtrid = %s LIMIT 1;"
-        cursor.execute(query2, (meterid,))
+        cursor.execute("EXECUTE sip_lookup (%s);", (meterid,))
         result2 = cursor.fetchone()
         sip_duration = int(result2[0]) if result2 and result2[0] else 15
 
-        logger.info(f"Metrics: {dt_name}, meterid: {meterid}, node_id: {node_id}, SIP: {sip_duration}min")
-        return dt_id, dt_name, meterid, node_id, sip_duration
-    except Exception as e:
-        logger.info(f"Database error: {e}")
-        return None, None, None, None, None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    logger.info("Metrics: %s, meterid: %s, node_id: %s, SIP: %smin", dt_name, meterid, node_id, sip_duration)
+    return dt_id, dt_name, meterid, node_id, sip_duration
+
+
+get_metrics.cache_clear = _get_metrics_cached.cache_clear
+
+
+NRM_DEMAND_COLUMNS = ['kw_i', 'kva_i', 'kvar_i']
+
+# Energy columns are parsed straight into float64 so the demand conversion needs no type inference
+RAW_ENERGY_DTYPES = dict.fromkeys(['kwh_i', 'kvah_i', 'kvar_i_total', 'kwh_abs', 'kvah_abs', 'kvarh_abs'], 'float64')
+
+
+def get_monthly_nrm_aggregates(start_ts, end_ts_exclusive, node_id):
+    """Aggregate the monthly NRM demand columns inside PostgreSQL - one row instead of every SIP"""
+    column_aggregates = ",\n               ".join(
+        f"MAX({col}), AVG({col}), "
+        f"(SELECT surveydate FROM m WHERE {col} IS NOT NULL ORDER BY {col} DESC, surveydate LIMIT 1)"
+        for col in NRM_DEMAND_COLUMNS)
+    nrm_query = f"""
+        WITH m AS (
+            SELECT surveydate, kw_i, kva_i, kvar_i
+            FROM {DatabaseConfig.TENANT_NAME}.tb_nrm_loadsurveyprofile
+            WHERE nodeid = %s AND surveydate >= %s AND surveydate < %s
+        )
+        SELECT COUNT(*),
+               {column_aggregates}
+        FROM m;
+    """
+
+    with db_conn('db2') as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(nrm_query, (node_id, start_ts, end_ts_exclusive))
+            row = cursor.fetchone()
+
+    nrm_summary = {'records': row[0]}
+    for i, col in enumerate(NRM_DEMAND_COLUMNS):
+        max_value, avg_value, max_at = row[1 + 3 * i:4 + 3 * i]
+        nrm_summary[col] = {
+            'max': float(max_value) if max_value is not None else None,
+            'avg': float(avg_value) if avg_value is not None else None,
+            'max_at': max_at
+        }
+    return nrm_summary
 
 
 @log_execution_time
 def get_database_data_for_monthly_sidepanel(month_info, mtr_id, node_id):
-    """Fetch database data for complete month - EXACT same as daywise logic"""
-    logger.info(f"Fetching monthly database data for: {month_info['selected_month_year']}")
+    """Fetch RAW rows and NRM aggregates for complete month - RAW same as daywise logic"""
+    logger.info("Fetching monthly database data for: %s", month_info['selected_month_year'])
 
-    start_date = month_info['start_date'].strftime("%Y-%m-%d")
-    end_date = month_info['end_date'].strftime("%Y-%m-%d")
-    date_filter = f"AND DATE(surveydate) >= '{start_date}' AND DATE(surveydate) <= '{end_date}'"
+    # Half-open range on the bare column so the (mtrid, surveydate) / (nodeid, surveydate) indexes are usable
+    # Native date objects are adapted by psycopg2 - no strftime/re-parse round trip
+    start_ts = month_info['start_date']
+    end_ts_exclusive = month_info['end_date'] + timedelta(days=1)
 
     try:
-        conn = psycopg2.connect(**DatabaseConfig.get_db2_params())
-
         # RAW QUERY - EXACT same as daywise
         raw_query = f"""
             SELECT DISTINCT surveydate, kwh_i, kvah_i, kvar_i_total, kwh_abs, kvah_abs, kvarh_abs
-            FROM {DatabaseConfig.TENANT_NAME}.tb_raw_loadsurveydata 
-            WHERE mtrid={mtr_id} {date_filter}
+            FROM {DatabaseConfig.TENANT_NAME}.tb_raw_loadsurveydata
+            WHERE mtrid = %s AND surveydate >= %s AND surveydate < %s
             ORDER BY surveydate ASC;
         """
 
-        # NRM QUERY - EXACT same as daywise
-        nrm_query = f"""
-            SELECT surveydate, kw_i, kva_i, kvar_i
-            FROM {DatabaseConfig.TENANT_NAME}.tb_nrm_loadsurveyprofile
-            WHERE nodeid={node_id} {date_filter}
-            ORDER BY surveydate ASC;
-        """
-
-        raw_df = pd.read_sql(raw_query, conn)
-        nrm_df = pd.read_sql(nrm_query, conn)
-
-        logger.info(f"Retrieved: Raw={len(raw_df)}, NRM={len(nrm_df)} records")
-
-        # DEBUG: Log RAW data statistics
-        if not raw_df.empty:
-            logger.info("=" * 60)
-            logger.info("DEBUG: RAW DATA STATISTICS")
-            logger.info(
-                f"  kwh_i - Min: {raw_df['kwh_i'].min()}, Max: {raw_df['kwh_i'].max()}, Non-null: {raw_df['kwh_i'].notna().sum()}")
-            logger.info(
-                f"  kvah_i - Min: {raw_df['kvah_i'].min()}, Max: {raw_df['kvah_i'].max()}, Non-null: {raw_df['kvah_i'].notna().sum()}")
-            logger.info(
-                f"  kvar_i_total - Min: {raw_df['kvar_i_total'].min()}, Max: {raw_df['kvar_i_total'].max()}, Non-null: {raw_df['kvar_i_total'].notna().sum()}")
-            logger.info(f"Sample RAW data (first 3):")
-            logger.info(raw_df[['surveydate', 'kwh_i', 'kvah_i', 'kvar_i_total']].head(3).to_string())
-            logger.info("=" * 60)
-
-        # DEBUG: Log NRM data statistics
-        if not nrm_df.empty:
-            logger.info("=" * 60)
-            logger.info("DEBUG: NRM DATA STATISTICS")
-            logger.info(
-                f"  kw_i - Min: {nrm_df['kw_i'].min()}, Max: {nrm_df['kw_i'].max()}, Non-null: {nrm_df['kw_i'].notna().sum()}")
-            logger.info(
-                f"  kva_i - Min: {nrm_df['kva_i'].min()}, Max: {nrm_df['kva_i'].max()}, Non-null: {nrm_df['kva_i'].notna().sum()}")
-            logger.info(
-                f"  kvar_i - Min: {nrm_df['kvar_i'].min()}, Max: {nrm_df['kvar_i'].max()}, Non-null: {nrm_df['kvar_i'].notna().sum()}")
-            logger.info(f"Sample NRM data (first 3):")
-            logger.info(nrm_df[['surveydate', 'kw_i', 'kva_i', 'kvar_i']].head(3).to_string())
-            logger.info("=" * 60)
-
-        if not nrm_df.empty:
-            nrm_df['date'] = pd.to_datetime(nrm_df['surveydate']).dt.date
-            sip_counts = nrm_df.groupby('date').size()
-            for date, count in sip_counts.items():
-                logger.info(f"   {date}: {count} SIPs available")
-
-        return raw_df, nrm_df
+        # RAW and NRM are independent - run them in parallel on two pooled connections
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            raw_future = executor.submit(read_sql_copy_pooled, 'db2', raw_query, (mtr_id, start_ts, end_ts_exclusive),
+                                         RAW_ENERGY_DTYPES)
+            nrm_future = executor.submit(get_monthly_nrm_aggregates, start_ts, end_ts_exclusive, node_id)
+            raw_df = raw_future.result()
+            nrm_summary = nrm_future.result()
+
+        logger.info("Retrieved: Raw=%s, NRM=%s records", len(raw_df), nrm_summary['records'])
+
+        # DEBUG: RAW/NRM statistics - only computed when DEBUG logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            if not raw_df.empty:
+                logger.debug("=" * 60)
+                logger.debug("DEBUG: RAW DATA STATISTICS")
+                for col in ['kwh_i', 'kvah_i', 'kvar_i_total']:
+                    logger.debug("  %s - Min: %s, Max: %s, Non-null: %s",
+                                 col, raw_df[col].min(), raw_df[col].max(), raw_df[col].notna().sum())
+                logger.debug("Sample RAW data (first 3):")
+                logger.debug(raw_df[['surveydate', 'kwh_i', 'kvah_i', 'kvar_i_total']].head(3).to_string())
+                logger.debug("=" * 60)
+
+                # floor('D') keeps datetime64 - no per-row datetime.date boxing; a no-op parse when already datetime
+                survey_days = pd.to_datetime(raw_df['surveydate'], format='%Y-%m-%d %H:%M:%S').dt.floor('D')
+                sip_counts = survey_days.groupby(survey_days, sort=False).size()
+                for day, count in sip_counts.items():
+                    logger.debug("   %s: %s SIPs available", day.date(), count)
+
+            if nrm_summary['records']:
+                logger.debug("=" * 60)
+                logger.debug("DEBUG: NRM DATA STATISTICS")
+                for col in NRM_DEMAND_COLUMNS:
+                    stats = nrm_summary[col]
+                    logger.debug("  %s - Max: %s at %s, Avg: %s", col, stats['max'], stats['max_at'], stats['avg'])
+                logger.debug("=" * 60)
+
+        return raw_df, nrm_summary
     except Exception as e:
-        logger.info(f"Database error: {e}")
-        return pd.DataFrame(), pd.DataFrame()
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.info("Database error: %s", e)
+        return pd.DataFrame(), {'records': 0}
 
 
 # ============================================================================
 # WEB AUTOMATION FUNCTIONS
 # ============================================================================
+def _wait(driver, t=10):
+    """Shared WebDriverWait factory - one default timeout and a 0.2s poll for the whole flow"""
+    return WebDriverWait(driver, t, poll_frequency=0.2)
+
+
 def login(driver):
     """Login to web application"""
     try:
         logger.info("Logging in...")
         driver.get("https://networkmonitoringpv.secure.online:10122/")
-        time.sleep(1)
-        driver.find_element(By.ID, "UserName").send_keys("Secure")
+        wait = _wait(driver, 15)
+        wait.until(EC.presence_of_element_located((By.ID, "UserName"))).send_keys("Secure")
         driver.find_element(By.ID, "Password").send_keys("Secure@12345")
-        time.sleep(10)
-        driver.find_element(By.ID, "btnlogin").click()
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//span[@class='dx-button-text' and text()='Continue']").click()
-        time.sleep(5)
+        wait.until(EC.element_to_be_clickable((By.ID, "btnlogin"))).click()
+        wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//span[@class='dx-button-text' and text()='Continue']"))).click()
         logger.info("Login successful")
         return True
     except Exception as e:
-        logger.info(f"Login failed: {e}")
+        logger.info("Login failed: %s", e)
         return False
 
 
 def select_dropdown_option(driver, dropdown_id, option_name):
     """Select dropdown option"""
     try:
-        logger.info(f"Selecting {option_name} in {dropdown_id}")
-        dropdown = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.ID, dropdown_id)))
+        logger.info("Selecting %s in %s", option_name, dropdown_id)
+        wait = _wait(driver)
+        dropdown = wait.until(EC.element_to_be_clickable((By.ID, dropdown_id)))
         dropdown.click()
-        WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".dx-list-item")))
+        wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".dx-list-item")))
         options = driver.find_elements(By.CSS_SELECTOR, ".dx-list-item")
         for option in options:
             if option.text.strip().lower() == option_name.lower():
                 option.click()
-                logger.info(f"Selected: {option_name}")
+                logger.info("Selected: %s", option_name)
                 return True
-        logger.info(f"Option not found: {option_name}")
+        logger.info("Option not found: %s", option_name)
         return False
     except Exception as e:
-        logger.info(f"Dropdown error: {e}")
+        logger.info("Dropdown error: %s", e)
         return False
 
 
 def set_calendar_month(driver, target_month_year):
     """Set calendar to target month and return month info"""
-    logger.info(f"Setting calendar to month: {target_month_year}")
+    logger.info("Setting calendar to month: %s", target_month_year)
     try:
+        wait = _wait(driver)
+
         # Click Month button
-        driver.find_element(By.XPATH, "//span[@class='dx-button-text' and text()='Month']").click()
-        time.sleep(1)
+        wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//span[@class='dx-button-text' and text()='Month']"))).click()
 
         # Set month
-        month_input = driver.find_element(By.XPATH, "//input[@class='dx-texteditor-input' and @aria-label='Date']")
+        month_input = wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//input[@class='dx-texteditor-input' and @aria-label='Date']")))
         month_input.clear()
         month_input.send_keys(target_month_year)
-        driver.find_element(By.XPATH, '//div[@id="dxSearchbtn"]').click()
-        time.sleep(2)
+        wait.until(EC.element_to_be_clickable((By.XPATH, '//div[@id="dxSearchbtn"]'))).click()
 
         # Parse month info
         month_name, year = target_month_year.split()
         month_num = datetime.strptime(month_name, "%B").month
         year = int(year)
 
-        start_date = datetime(year, month_num, 1).date()
-        if month_num == 12:
-            end_date = datetime(year + 1, 1, 1).date() - pd.Timedelta(days=1)
-        else:
-            end_date = datetime(year, month_num + 1, 1).date() - pd.Timedelta(days=1)
+        days_in_month = calendar.monthrange(year, month_num)[1]
+        start_date = date(year, month_num, 1)
+        end_date = date(year, month_num, days_in_month)
 
         month_info = {
             'selected_month_year': target_month_year,
             'month_num': month_num,
             'year': year,
             'start_date': start_date,
-            'end_date': end_date
+            'end_date': end_date,
+            'days_in_month': days_in_month
         }
 
         logger.info("Month set successfully")
-        logger.info(f"Complete month range: {start_date} to {end_date}")
+        logger.info("Complete month range: %s to %s", start_date, end_date)
         return month_info
     except Exception as e:
-        logger.info(f"Month setting error: {e}")
+        logger.info("Month setting error: %s", e)
         return None
 
 
@@ -497,21 +657,21 @@ def select_type(driver):
     """Select LV monitoring - FIXED FOR LV ONLY"""
     try:
         logger.info("Selecting LV monitoring (fixed for LV monthly side panel script)")
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//A[@id='divHome']").click()
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//A[@id='divlvmonitoring']").click()
+        wait = _wait(driver, 15)
+        wait.until(EC.element_to_be_clickable((By.XPATH, "//A[@id='divHome']"))).click()
+        wait.until(EC.element_to_be_clickable((By.XPATH, "//A[@id='divlvmonitoring']"))).click()
         logger.info("LV monitoring selected")
-        time.sleep(3)
+        # Area dropdown is the next element touched
+        wait.until(EC.element_to_be_clickable((By.ID, "ddl-area")))
     except Exception as e:
-        logger.info(f"Type selection error: {e}")
+        logger.info("Type selection error: %s", e)
 
 
 def select_meter_type(driver, meter_type):
     """Select meter type - DT or LV only"""
     try:
-        logger.info(f"Selecting meter type: {meter_type}")
-        wait = WebDriverWait(driver, 10)
+        logger.info("Selecting meter type: %s", meter_type)
+        wait = _wait(driver)
 
         if meter_type == "DT":
             dt_button = wait.until(EC.element_to_be_clickable((By.XPATH, '//div[@id="DTClick"]')))
@@ -525,23 +685,44 @@ def select_meter_type(driver, meter_type):
             logger.info("Invalid meter type for LV monitoring")
             return False
 
-        time.sleep(3)
         return True
     except Exception as e:
-        logger.info(f"Meter type error: {e}")
+        logger.info("Meter type error: %s", e)
         return False
 
 
+# Clicks the View link whose grid row contains the serial; returns its 1-based position or 0 when absent
+CLICK_VIEW_FOR_SERIAL_JS = """
+    const links = Array.from(document.querySelectorAll('a')).filter(a => a.textContent.trim() === 'View');
+    for (let i = 0; i < links.length; i++) {
+        const row = links[i].closest('tr');
+        if (row && row.innerText.includes(arguments[0])) {
+            links[i].click();
+            return i + 1;
+        }
+    }
+    return 0;
+"""
+
+
 @log_execution_time
 def find_and_click_view_using_search(driver, wait, meter_serial_no):
     """Find meter using search box and click View"""
-    logger.info(f"Searching for meter: {meter_serial_no}")
+    logger.info("Searching for meter: %s", meter_serial_no)
     try:
         search_input = wait.until(EC.presence_of_element_located(
             (By.XPATH, "//input[@placeholder='Search grid' and @aria-label='Search in the data grid']")))
         search_input.clear()
         search_input.send_keys(meter_serial_no)
-        time.sleep(2)
+
+        # Poll until the filtered grid shows the meter's row, then click its View link - one script call per poll
+        try:
+            row_number = _wait(driver, 5).until(
+                lambda d: d.execute_script(CLICK_VIEW_FOR_SERIAL_JS, meter_serial_no))
+            logger.info("View clicked (exact match at row %s)", row_number)
+            return True
+        except TimeoutException:
+            logger.info("Exact match not found by script, falling back to View button scan")
 
         view_buttons = driver.find_elements(By.XPATH, "//a[text()='View']")
         if not view_buttons:
@@ -553,13 +734,13 @@ def find_and_click_view_using_search(driver, wait, meter_serial_no):
             logger.info("View clicked (1 result)")
             return True
 
-        logger.info(f"Found {len(view_buttons)} results, finding exact match")
+        logger.info("Found %s results, finding exact match", len(view_buttons))
         for idx, view_btn in enumerate(view_buttons):
             try:
                 parent_row = view_btn.find_element(By.XPATH, "./ancestor::tr")
                 if meter_serial_no in parent_row.text:
                     view_btn.click()
-                    logger.info(f"View clicked (exact match at row {idx + 1})")
+                    logger.info("View clicked (exact match at row %s)", idx + 1)
                     return True
             except:
                 continue
@@ -568,10 +749,18 @@ def find_and_click_view_using_search(driver, wait, meter_serial_no):
         logger.info("View clicked (first result)")
         return True
     except Exception as e:
-        logger.info(f"Search error: {e}")
+        logger.info("Search error: %s", e)
         return False
 
 
+# Side panel data key -> <td> id (Active, Apparent, Reactive)
+SIDE_PANEL_CELL_IDS = {
+    'act_max': 'maxDemand_Kw', 'act_avg': 'avgDemand_Kw', 'act_dt': 'kw_MaxDatetime',
+    'app_max': 'maxDemand_Kva', 'app_avg': 'avgDemand_Kva', 'app_dt': 'kva_MaxDatetime',
+    'react_max': 'maxDemand_Kvar', 'react_avg': 'avgDemand_Kvar', 'react_dt': 'kvar_MaxDatetime'
+}
+
+
 @log_execution_time
 def collect_side_panel_data(driver, wait):
     """Collect data from demand side panel (demand table) - SIDE PANEL ONLY"""
@@ -582,36 +771,27 @@ def collect_side_panel_data(driver, wait):
         # Navigate to detailed demand page
         logger.info("Navigating to detailed view...")
         wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@id="VPDetailedLink"]'))).click()
-        time.sleep(2)
 
         logger.info("Clicking Demand tab...")
         wait.until(
             EC.element_to_be_clickable((By.XPATH, '//span[@class="dx-tab-text-span" and text()="Demand"]'))).click()
-        time.sleep(3)
+        # Side panel is filled asynchronously - wait until the first value is rendered
+        wait.until(lambda d: d.find_element(By.XPATH, '//td[@id="maxDemand_Kw"]').text.strip())
 
         logger.info("Extracting side panel values...")
-        # Active Power Data
-        data['act_max'] = driver.find_element(By.XPATH, '//td[@id="maxDemand_Kw"]').text
-        data['act_avg'] = driver.find_element(By.XPATH, '//td[@id="avgDemand_Kw"]').text
-        data['act_dt'] = driver.find_element(By.XPATH, '//td[@id="kw_MaxDatetime"]').text
-
-        # Apparent Power Data
-        data['app_max'] = driver.find_element(By.XPATH, '//td[@id="maxDemand_Kva"]').text
-        data['app_avg'] = driver.find_element(By.XPATH, '//td[@id="avgDemand_Kva"]').text
-        data['app_dt'] = driver.find_element(By.XPATH, '//td[@id="kva_MaxDatetime"]').text
-
-        # Reactive Power Data
-        data['react_max'] = driver.find_element(By.XPATH, '//td[@id="maxDemand_Kvar"]').text
-        data['react_avg'] = driver.find_element(By.XPATH, '//td[@id="avgDemand_Kvar"]').text
-        data['react_dt'] = driver.find_element(By.XPATH, '//td[@id="kvar_MaxDatetime"]').text
+        # All 9 cells in one WebDriver round-trip instead of a find_element + text call per cell
+        values = driver.execute_script(
+            "return arguments[0].map(id => ((document.getElementById(id) || {}).innerText || '').trim());",
+            list(SIDE_PANEL_CELL_IDS.values()))
+        data.update(zip(SIDE_PANEL_CELL_IDS, values))
 
         logger.info("Side panel data collected successfully:")
-        logger.info(f"   Active: Max={data['act_max']}, Avg={data['act_avg']}, DT={data['act_dt']}")
-        logger.info(f"   Apparent: Max={data['app_max']}, Avg={data['app_avg']}, DT={data['app_dt']}")
-        logger.info(f"   Reactive: Max={data['react_max']}, Avg={data['react_avg']}, DT={data['react_dt']}")
+        logger.info("   Active: Max=%s, Avg=%s, DT=%s", data['act_max'], data['act_avg'], data['act_dt'])
+        logger.info("   Apparent: Max=%s, Avg=%s, DT=%s", data['app_max'], data['app_avg'], data['app_dt'])
+        logger.info("   Reactive: Max=%s, Avg=%s, DT=%s", data['react_max'], data['react_avg'], data['react_dt'])
 
     except Exception as e:
-        logger.error(f"Error collecting side panel data: {str(e)}")
+        logger.error("Error collecting side panel data: %s", e)
         raise
 
     return data
@@ -623,8 +803,7 @@ def save_side_panel_data_to_excel(side_data, month_info, sip_duration):
     logger.info("Saving demand side panel data to Excel...")
 
     try:
-        wb = Workbook()
-        wb.remove(wb.active)
+        wb = Workbook(write_only=True)  # Rows are streamed; write-only workbooks start without a sheet
 
         # Demand Table Sheet
         ws_demand = wb.create_sheet("Demand Table")
@@ -649,7 +828,7 @@ def save_side_panel_data_to_excel(side_data, month_info, sip_duration):
         ws_sip.append(["SIP Duration (minutes)", sip_duration])
         ws_sip.append(["Expected SIPs per day", (24 * 60) // sip_duration])
         ws_sip.append(["Month Analyzed", month_info['selected_month_year']])
-        days_in_month = (month_info['end_date'] - month_info['start_date']).days + 1
+        days_in_month = month_info['days_in_month']
         ws_sip.append(["Days in Month", days_in_month])
         ws_sip.append(["Expected Total SIPs for Month", days_in_month * ((24 * 60) // sip_duration)])
 
@@ -673,18 +852,28 @@ def format_datetime(dt_value):
         if pd.isna(dt_value) or dt_value is None:
             return "No valid data"
         if isinstance(dt_value, pd.Timestamp):
-            return dt_value.strftime(f'{dt_value.day} %b at %H:%M')
+            return f"{dt_value.day} {dt_value.strftime('%b at %H:%M')}"
         elif isinstance(dt_value, str):
             dt_obj = pd.to_datetime(dt_value)
-            return dt_obj.strftime(f'{dt_obj.day} %b - %H:%M')
+            return f"{dt_obj.day} {dt_obj.strftime('%b - %H:%M')}"
         else:
             return str(dt_value)
     except Exception:
         return "Invalid datetime"
 
 
+def reduce_demand(values):
+    """Max, mean and position of max of a demand array in NaN-aware passes; None when no valid value"""
+    values = np.ascontiguousarray(values)
+    if np.isnan(values).all():
+        return None
+    max_idx = int(np.nanargmax(values))
+    # Float32 demand is plenty for 2-decimal display, but the month-long mean is accumulated in float64
+    return float(values[max_idx]), float(np.nanmean(values, dtype=np.float64)), max_idx
+
+
 @log_execution_time
-def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_duration):
+def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_summary, month_info, sip_duration):
     """Calculate demand side panel metrics - EXACT same logic as daywise"""
     logger.info(
         f"Calculating demand side panel metrics with {sip_duration}-minute SIP intervals for complete month...")
@@ -693,15 +882,25 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
     timestamp = datetime.now().strftime('%Y%m%d_%H%M')
 
     logger.info(f"Processing RAW data: {len(raw_df)} records")
-    logger.info(f"Processing NRM data: {len(nrm_df)} records")
+    logger.info(f"Processing NRM data: {nrm_summary['records']} records")
 
-    df_raw = raw_df.copy()
-    df_raw['surveydate'] = pd.to_datetime(df_raw['surveydate'])
+    # No copy of raw_df - only the timestamps and the three demand arrays are carried forward
+    surveydate = raw_df['surveydate']
+    if not pd.api.types.is_datetime64_any_dtype(surveydate):
+        # The COPY loader already parses timestamps - only fall back to an ISO8601 parse for other sources
+        surveydate = pd.to_datetime(surveydate, errors='coerce', format='ISO8601')
+    missing_demand = np.full(len(raw_df), np.nan, dtype=np.float32)
 
     # Calculate SIP duration in hours for conversion - EXACT same as daywise
     sip_duration_in_hr = sip_duration / 60
+    # Multiply by the reciprocal instead of dividing per row; float32 keeps the demand arrays float32
+    inv_sip_duration_in_hr = np.float32(1.0 / sip_duration_in_hr)
     logger.info(f"Converting energy to demand using SIP duration: {sip_duration_in_hr} hours")
 
+    def energy_to_demand(col):
+        """Coerce one energy column to a float32 array (NaN for non-numeric) and convert it to demand"""
+        return pd.to_numeric(raw_df[col], errors='coerce').to_numpy(dtype=np.float32) * inv_sip_duration_in_hr
+
     # NEW LOGIC:
     # 1. Active Power (kW): ALWAYS use kwh_abs
     # 2. Apparent Power (kVA): ALWAYS use kvah_abs
@@ -717,84 +916,73 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
     # Convert energy to demand (Power = Energy / Time)
 
     # ACTIVE POWER - ALWAYS from ABS
-    if 'kwh_abs' in df_raw.columns:
-        df_raw['kw_calculated'] = pd.to_numeric(df_raw['kwh_abs'], errors='coerce') / sip_duration_in_hr
-        logger.info(f"Active Power: Using kwh_abs, converted {df_raw['kw_calculated'].notna().sum()} records")
+    if 'kwh_abs' in raw_df.columns:
+        kw = energy_to_demand('kwh_abs')
+        logger.info(f"Active Power: Using kwh_abs, converted {np.count_nonzero(~np.isnan(kw))} records")
     else:
         logger.error("CRITICAL: kwh_abs column not found!")
-        df_raw['kw_calculated'] = None
+        kw = missing_demand
 
     # APPARENT POWER - ALWAYS from ABS
-    if 'kvah_abs' in df_raw.columns:
-        df_raw['kva_calculated'] = pd.to_numeric(df_raw['kvah_abs'], errors='coerce') / sip_duration_in_hr
-        logger.info(f"Apparent Power: Using kvah_abs, converted {df_raw['kva_calculated'].notna().sum()} records")
+    if 'kvah_abs' in raw_df.columns:
+        kva = energy_to_demand('kvah_abs')
+        logger.info(f"Apparent Power: Using kvah_abs, converted {np.count_nonzero(~np.isnan(kva))} records")
     else:
         logger.error("CRITICAL: kvah_abs column not found!")
-        df_raw['kva_calculated'] = None
+        kva = missing_demand
 
     # REACTIVE POWER - IMPORT first, fallback to ABS if NULL
-    if 'kvar_i_total' in df_raw.columns and 'kvarh_abs' in df_raw.columns:
-        # Start with IMPORT values
-        df_raw['kvar_calculated'] = pd.to_numeric(df_raw['kvar_i_total'], errors='coerce') / sip_duration_in_hr
-        import_count = df_raw['kvar_calculated'].notna().sum()
-
-        # Fill NULL values with ABS
-        null_mask = df_raw['kvar_calculated'].isna()
-        df_raw.loc[null_mask, 'kvar_calculated'] = pd.to_numeric(df_raw.loc[null_mask, 'kvarh_abs'],
-                                                                 errors='coerce') / sip_duration_in_hr
-        abs_filled = df_raw.loc[null_mask, 'kvar_calculated'].notna().sum()
+    if 'kvar_i_total' in raw_df.columns and 'kvarh_abs' in raw_df.columns:
+        # Start with IMPORT values, fill NULL values with ABS - one vectorized select, no masked .loc writes
+        kvar_import = energy_to_demand('kvar_i_total')
+        kvar_abs = energy_to_demand('kvarh_abs')
+        null_mask = np.isnan(kvar_import)
+        kvar = np.where(null_mask, kvar_abs, kvar_import)
+        # Both counts come from the masks already in hand - no boolean-indexed copy of kvar
+        import_count = kvar_import.size - int(np.count_nonzero(null_mask))
+        abs_filled = int(np.count_nonzero(null_mask & ~np.isnan(kvar_abs)))
 
         logger.info(
             f"Reactive Power: Using kvar_i_total for {import_count} records, filled {abs_filled} NULLs from kvarh_abs")
-    elif 'kvar_i_total' in df_raw.columns:
-        df_raw['kvar_calculated'] = pd.to_numeric(df_raw['kvar_i_total'], errors='coerce') / sip_duration_in_hr
+    elif 'kvar_i_total' in raw_df.columns:
+        kvar = energy_to_demand('kvar_i_total')
         logger.info(f"Reactive Power: Using only kvar_i_total (kvarh_abs not available)")
-    elif 'kvarh_abs' in df_raw.columns:
-        df_raw['kvar_calculated'] = pd.to_numeric(df_raw['kvarh_abs'], errors='coerce') / sip_duration_in_hr
+    elif 'kvarh_abs' in raw_df.columns:
+        kvar = energy_to_demand('kvarh_abs')
         logger.info(f"Reactive Power: Using only kvarh_abs (kvar_i_total not available)")
     else:
         logger.error("CRITICAL: Neither kvar_i_total nor kvarh_abs found!")
-        df_raw['kvar_calculated'] = None
+        kvar = missing_demand
 
     logger.info("Converted RAW energy to demand")
 
-    # DEBUG: Log sample of converted data
-    if not df_raw.empty:
-        logger.info("=" * 60)
-        logger.info("DEBUG: Sample of converted data (first 5 records):")
-        logger.info(df_raw[['surveydate', 'kw_calculated', 'kva_calculated', 'kvar_calculated']].head().to_string())
-        logger.info(f"DEBUG: Total records with valid kw_calculated: {df_raw['kw_calculated'].notna().sum()}")
-        logger.info(
-            f"DEBUG: kw_calculated range: {df_raw['kw_calculated'].min():.2f} to {df_raw['kw_calculated'].max():.2f}")
-        logger.info(
-            f"DEBUG: kva_calculated range: {df_raw['kva_calculated'].min():.2f} to {df_raw['kva_calculated'].max():.2f}")
-        logger.info(
-            f"DEBUG: kvar_calculated range: {df_raw['kvar_calculated'].min():.2f} to {df_raw['kvar_calculated'].max():.2f}")
-        logger.info("=" * 60)
+    # Small frame of just the derived columns for the debug sample and the analysis sheet
+    df_demand = pd.DataFrame({
+        'surveydate': surveydate,
+        'kw_calculated': kw,
+        'kva_calculated': kva,
+        'kvar_calculated': kvar
+    })
+
+    # DEBUG: Sample of converted data - only computed when DEBUG logging is enabled
+    if logger.isEnabledFor(logging.DEBUG) and not df_demand.empty:
+        demand_columns = ['kw_calculated', 'kva_calculated', 'kvar_calculated']
+        demand_stats = df_demand[demand_columns].agg(['min', 'max', 'count'])
+        logger.debug("=" * 60)
+        logger.debug("DEBUG: Sample of converted data (first 5 records):")
+        logger.debug(df_demand.head().to_string())
+        logger.debug("DEBUG: Total records with valid kw_calculated: %d", demand_stats.at['count', 'kw_calculated'])
+        for col in demand_columns:
+            logger.debug("DEBUG: %s range: %.2f to %.2f", col, demand_stats.at['min', col], demand_stats.at['max', col])
+        logger.debug("=" * 60)
 
     # Safe demand calculation function - EXACT same as daywise
-    def safe_demand_calculation(demand_series, datetime_series, param_name):
+    def safe_demand_calculation(reduced, datetime_series, param_name):
         try:
-            numeric_series = pd.to_numeric(demand_series, errors='coerce')
-            valid_mask = ~pd.isna(numeric_series)
-
-            if not valid_mask.any():
-                logger.warning(f"No valid data for {param_name}")
-                return 0.0, 0.0, "No valid data"
-
-            valid_data = numeric_series[valid_mask]
-            max_val = round(valid_data.max(), 2)
-            avg_val = round(valid_data.mean(), 2)
-
-            if pd.isna(max_val):
-                max_datetime_formatted = "No valid data"
-            else:
-                max_idx = numeric_series.idxmax()
-                if pd.isna(max_idx):
-                    max_datetime_formatted = "No valid data"
-                else:
-                    max_datetime = datetime_series.iloc[max_idx]
-                    max_datetime_formatted = format_datetime(max_datetime)
+            max_value, avg_value, max_idx = reduced
+            max_val = round(max_value, 2)
+            avg_val = round(avg_value, 2)
+            max_datetime_formatted = format_datetime(datetime_series.iat[max_idx])
 
             return max_val, avg_val, max_datetime_formatted
 
@@ -803,12 +991,14 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
             return 0.0, 0.0, "Calculation error"
 
     # Calculate demand table metrics - Using new converted columns
+    # Each array is reduced once; the Data Analysis sheet reuses these results
+    kw_reduced, kva_reduced, kvar_reduced = reduce_demand(kw), reduce_demand(kva), reduce_demand(kvar)
     calculated_data = {}
 
     # Active Power - from kw_calculated (which uses kwh_abs)
-    if 'kw_calculated' in df_raw.columns and df_raw['kw_calculated'].notna().any():
+    if kw_reduced is not None:
         active_max, active_avg, active_max_time = safe_demand_calculation(
-            df_raw['kw_calculated'], df_raw['surveydate'], "Active Power"
+            kw_reduced, surveydate, "Active Power"
         )
         calculated_data['Active(kW)'] = {
             'Max': f"{active_max:.2f}",
@@ -822,9 +1012,9 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
         logger.warning("No valid Active Power data")
 
     # Apparent Power - from kva_calculated (which uses kvah_abs)
-    if 'kva_calculated' in df_raw.columns and df_raw['kva_calculated'].notna().any():
+    if kva_reduced is not None:
         apparent_max, apparent_avg, apparent_max_time = safe_demand_calculation(
-            df_raw['kva_calculated'], df_raw['surveydate'], "Apparent Power"
+            kva_reduced, surveydate, "Apparent Power"
         )
         calculated_data['Apparent(kVA)'] = {
             'Max': f"{apparent_max:.2f}",
@@ -838,9 +1028,9 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
         logger.warning("No valid Apparent Power data")
 
     # Reactive Power - from kvar_calculated (which uses kvar_i_total with fallback to kvarh_abs)
-    if 'kvar_calculated' in df_raw.columns and df_raw['kvar_calculated'].notna().any():
+    if kvar_reduced is not None:
         reactive_max, reactive_avg, reactive_max_time = safe_demand_calculation(
-            df_raw['kvar_calculated'], df_raw['surveydate'], "Reactive Power"
+            kvar_reduced, surveydate, "Reactive Power"
         )
         calculated_data['Reactive(kVAr)'] = {
             'Max': f"{reactive_max:.2f}",
@@ -855,8 +1045,7 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
 
     # Save calculated data to Excel - EXACT same as daywise
     calculated_file = f"calculated_demand_side_panel_data_{month_year_safe}_{timestamp}.xlsx"
-    wb = Workbook()
-    wb.remove(wb.active)
+    wb = Workbook(write_only=True)  # All three sheets are append-only - stream rows to XML
 
     # Demand Table Sheet
     ws_demand = wb.create_sheet('Demand Table')
@@ -871,7 +1060,7 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
     ws_sip.append(['SIP Duration (minutes)', sip_duration])
     ws_sip.append(['Expected SIPs per day', (24 * 60) // sip_duration])
     ws_sip.append(['Actual SIPs', len(raw_df)])
-    days_in_month = (month_info['end_date'] - month_info['start_date']).days + 1
+    days_in_month = month_info['days_in_month']
     expected_total = days_in_month * ((24 * 60) // sip_duration)
     ws_sip.append(['Days in Month', days_in_month])
     ws_sip.append(['Expected Total SIPs for Month', expected_total])
@@ -880,24 +1069,27 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
     # Raw Data Analysis Sheet
     ws_analysis = wb.create_sheet('Data Analysis')
     ws_analysis.append(['Metric', 'Value'])
-    if not df_raw.empty:
-        ws_analysis.append(['Total Records', len(df_raw)])
-        ws_analysis.append(['Date Range', f"{df_raw['surveydate'].min()} to {df_raw['surveydate'].max()}"])
+    if not raw_df.empty:
+        ws_analysis.append(['Total Records', len(raw_df)])
+        # RAW rows come back ORDER BY surveydate, so the range is normally just the first and last values
+        if surveydate.is_monotonic_increasing:
+            first_survey, last_survey = surveydate.iat[0], surveydate.iat[-1]
+        else:
+            first_survey, last_survey = surveydate.agg(['min', 'max'])
+        ws_analysis.append(['Date Range', f"{first_survey} to {last_survey}"])
         ws_analysis.append(['', ''])
         ws_analysis.append(['Source Data Used:', ''])
         ws_analysis.append(['Active Power', 'kwh_abs (ALWAYS)'])
         ws_analysis.append(['Apparent Power', 'kvah_abs (ALWAYS)'])
         ws_analysis.append(['Reactive Power', 'kvar_i_total → kvarh_abs (if NULL)'])
         ws_analysis.append(['', ''])
-        if 'kw_calculated' in df_raw.columns:
-            ws_analysis.append(['Max Active Demand (kW)', f"{df_raw['kw_calculated'].max():.2f}"])
-            ws_analysis.append(['Avg Active Demand (kW)', f"{df_raw['kw_calculated'].mean():.2f}"])
-        if 'kva_calculated' in df_raw.columns:
-            ws_analysis.append(['Max Apparent Demand (kVA)', f"{df_raw['kva_calculated'].max():.2f}"])
-            ws_analysis.append(['Avg Apparent Demand (kVA)', f"{df_raw['kva_calculated'].mean():.2f}"])
-        if 'kvar_calculated' in df_raw.columns:
-            ws_analysis.append(['Max Reactive Demand (kVAr)', f"{df_raw['kvar_calculated'].max():.2f}"])
-            ws_analysis.append(['Avg Reactive Demand (kVAr)', f"{df_raw['kvar_calculated'].mean():.2f}"])
+        # Max/mean from the Demand Table reductions above - no second pass over the arrays
+        for label, reduced in [('Active Demand (kW)', kw_reduced),
+                               ('Apparent Demand (kVA)', kva_reduced),
+                               ('Reactive Demand (kVAr)', kvar_reduced)]:
+            max_value, avg_value, _ = reduced or (np.nan, np.nan, None)
+            ws_analysis.append([f'Max {label}', f"{max_value:.2f}"])
+            ws_analysis.append([f'Avg {label}', f"{avg_value:.2f}"])
 
     wb.save(calculated_file)
 
@@ -909,6 +1101,17 @@ def calculate_side_panel_metrics_from_raw_data(raw_df, nrm_df, month_info, sip_d
 # ============================================================================
 # COMPARISON AND VALIDATION
 # ============================================================================
+_NUM_RE = re.compile(r'[-+]?(\d*\.?\d+)')
+_SENTINEL_SET = frozenset({'nan', 'none', '-', ''})
+SheetResult = namedtuple('SheetResult', 'items matches')
+
+# Validation fills are immutable style values - build them once instead of on every comparison
+_GREEN_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+_RED_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+_YELLOW_FILL = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+_HEADER_FILL = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+
+
 @log_execution_time
 def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duration):
     """Create complete monthly side panel comparison with validation"""
@@ -921,32 +1124,36 @@ def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duratio
         # Load workbooks
         wb_ui = load_workbook(ui_file)
         wb_calc = load_workbook(calculated_file)
-        wb_output = Workbook()
-        wb_output.remove(wb_output.active)
+        wb_output = Workbook(write_only=True)  # No default sheet to remove; rows are streamed in order
 
-        # Colors
-        green = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-        red = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-        yellow = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-        header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+        def filled_cell(ws, value, fill):
+            """Write-only cell carrying a fill - plain values are appended as-is"""
+            cell = WriteOnlyCell(ws, value=value)
+            cell.fill = fill
+            return cell
 
         def normalize_string(s):
             """Remove all spaces and lowercase for fair string comparison"""
-            if s is None or str(s).lower() in ['nan', 'none', '-']:
+            if s is None or str(s).lower() in _SENTINEL_SET:
                 return ""
             return str(s).replace(" ", "").strip().lower()
 
         def extract_numeric_value(s):
             """Extract numeric value from string"""
-            try:
-                if s is None or str(s).lower() in ['nan', 'none', '-', '']:
-                    return None
-                numeric_match = re.search(r'[-+]?(\d*\.?\d+)', str(s))
-                if numeric_match:
-                    return float(numeric_match.group())
+            if s is None:
                 return None
-            except:
+            text = str(s).strip().lower()
+            if text in _SENTINEL_SET:
                 return None
+            numeric_match = _NUM_RE.search(text)
+            return float(numeric_match.group()) if numeric_match else None
+
+        def tolerance_match(ui_values, calc_values, tolerance):
+            """Vectorized tolerance check; returns (match, has_data) as lists of bools"""
+            has_data = ~(np.isnan(ui_values) | np.isnan(calc_values))
+            # Zero on either side only matches an exact zero, which the relative bound already implies
+            within = np.abs(ui_values - calc_values) <= np.maximum(np.abs(ui_values), np.abs(calc_values)) * tolerance
+            return (has_data & within).tolist(), has_data.tolist()
 
         # Compare Demand Table sheets
         validation_results = {}
@@ -959,113 +1166,80 @@ def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duratio
             headers = ['Parameter', 'UI_Max', 'Calc_Max', 'Max_Match',
                        'UI_Avg', 'Calc_Avg', 'Avg_Match',
                        'UI_DateTime', 'Calc_DateTime', 'DateTime_Match', 'Overall_Match']
-            for col, header in enumerate(headers, 1):
-                cell = ws_new.cell(row=1, column=col, value=header)
-                cell.fill = header_fill
+            ws_new.append([filled_cell(ws_new, header, _HEADER_FILL) for header in headers])
 
             total_matches = 0
             total_comparisons = 0
             tolerance = 0.02  # 2% tolerance
-            sheet_results = []
-
-            row_num = 2
-            for row in range(2, max(ws_ui.max_row, ws_calc.max_row) + 1):
-                if row <= ws_ui.max_row and row <= ws_calc.max_row:
-                    # Get UI values
-                    param_ui = ws_ui.cell(row=row, column=1).value
-                    max_ui = ws_ui.cell(row=row, column=2).value
-                    avg_ui = ws_ui.cell(row=row, column=3).value
-                    dt_ui = ws_ui.cell(row=row, column=4).value
-
-                    # Get calculated values
-                    param_calc = ws_calc.cell(row=row, column=1).value
-                    max_calc = ws_calc.cell(row=row, column=2).value
-                    avg_calc = ws_calc.cell(row=row, column=3).value
-                    dt_calc = ws_calc.cell(row=row, column=4).value
-
-                    if param_ui or param_calc:
-                        param = param_ui or param_calc
-
-                        # Compare Max values
-                        max_ui_num = extract_numeric_value(max_ui)
-                        max_calc_num = extract_numeric_value(max_calc)
-                        if max_ui_num is not None and max_calc_num is not None:
-                            if max_ui_num == 0 or max_calc_num == 0:
-                                max_match = (max_ui_num == max_calc_num)
-                            else:
-                                max_match = abs(max_ui_num - max_calc_num) <= (
-                                        max(abs(max_ui_num), abs(max_calc_num)) * tolerance)
-                            max_match_str = 'YES' if max_match else 'NO'
-                            max_match_color = green if max_match else red
-                        else:
-                            max_match_str = 'NO DATA'
-                            max_match_color = yellow
-                            max_match = False
-
-                        # Compare Avg values
-                        avg_ui_num = extract_numeric_value(avg_ui)
-                        avg_calc_num = extract_numeric_value(avg_calc)
-                        if avg_ui_num is not None and avg_calc_num is not None:
-                            if avg_ui_num == 0 or avg_calc_num == 0:
-                                avg_match = (avg_ui_num == avg_calc_num)
-                            else:
-                                avg_match = abs(avg_ui_num - avg_calc_num) <= (
-                                        max(abs(avg_ui_num), abs(avg_calc_num)) * tolerance)
-                            avg_match_str = 'YES' if avg_match else 'NO'
-                            avg_match_color = green if avg_match else red
-                        else:
-                            avg_match_str = 'NO DATA'
-                            avg_match_color = yellow
-                            avg_match = False
-
-                        # Compare DateTime - more lenient
-                        dt_ui_str = normalize_string(dt_ui)
-                        dt_calc_str = normalize_string(dt_calc)
-                        if dt_ui_str and dt_calc_str and dt_ui_str not in ['novaliddata',
-                                                                           'invaliddata'] and dt_calc_str not in [
-                            'novaliddata', 'invaliddata']:
-                            dt_match = (dt_ui_str == dt_calc_str)
-                        else:
-                            dt_match = True  # Don't fail on datetime if both calculations passed
-                        dt_match_str = 'YES' if dt_match else 'NO'
-                        dt_match_color = green if dt_match else yellow
-
-                        # Overall match - prioritize numeric values
-                        overall_match = max_match and avg_match
-                        overall_match_str = 'YES' if overall_match else 'NO'
-                        overall_match_color = green if overall_match else red
-
-                        # Write to validation report
-                        ws_new.cell(row=row_num, column=1, value=param)
-                        ws_new.cell(row=row_num, column=2, value=max_ui)
-                        ws_new.cell(row=row_num, column=3, value=max_calc)
-                        max_cell = ws_new.cell(row=row_num, column=4, value=max_match_str)
-                        max_cell.fill = max_match_color
-
-                        ws_new.cell(row=row_num, column=5, value=avg_ui)
-                        ws_new.cell(row=row_num, column=6, value=avg_calc)
-                        avg_cell = ws_new.cell(row=row_num, column=7, value=avg_match_str)
-                        avg_cell.fill = avg_match_color
-
-                        ws_new.cell(row=row_num, column=8, value=dt_ui)
-                        ws_new.cell(row=row_num, column=9, value=dt_calc)
-                        dt_cell = ws_new.cell(row=row_num, column=10, value=dt_match_str)
-                        dt_cell.fill = dt_match_color
-
-                        overall_cell = ws_new.cell(row=row_num, column=11, value=overall_match_str)
-                        overall_cell.fill = overall_match_color
-
-                        sheet_results.append({
-                            'item': param,
-                            'match': overall_match
-                        })
-
-                        if overall_match:
-                            total_matches += 1
-                        total_comparisons += 1
-                        row_num += 1
-
-            validation_results['Demand Table'] = sheet_results
+            sheet_items, sheet_matches = [], []
+
+            # Read both tables in one pass each - rows present in both sheets are compared
+            ui_rows = ws_ui.iter_rows(min_row=2, max_col=4, values_only=True)
+            calc_rows = ws_calc.iter_rows(min_row=2, max_col=4, values_only=True)
+            rows = [(ui_row, calc_row) for ui_row, calc_row in zip(ui_rows, calc_rows) if ui_row[0] or calc_row[0]]
+
+            # Max/Avg tolerance checks for all parameters at once - columns are UI/Calc Max, UI/Calc Avg
+            numeric = np.array([[extract_numeric_value(ui_row[1]), extract_numeric_value(calc_row[1]),
+                                 extract_numeric_value(ui_row[2]), extract_numeric_value(calc_row[2])]
+                                for ui_row, calc_row in rows], dtype=np.float64).reshape(-1, 4)
+            max_matches, max_has_data = tolerance_match(numeric[:, 0], numeric[:, 1], tolerance)
+            avg_matches, avg_has_data = tolerance_match(numeric[:, 2], numeric[:, 3], tolerance)
+
+            for i, (ui_row, calc_row) in enumerate(rows):
+                param_ui, max_ui, avg_ui, dt_ui = ui_row
+                param_calc, max_calc, avg_calc, dt_calc = calc_row
+
+                param = param_ui or param_calc
+
+                max_match = max_matches[i]
+                if max_has_data[i]:
+                    max_match_str = 'YES' if max_match else 'NO'
+                    max_match_color = _GREEN_FILL if max_match else _RED_FILL
+                else:
+                    max_match_str = 'NO DATA'
+                    max_match_color = _YELLOW_FILL
+
+                avg_match = avg_matches[i]
+                if avg_has_data[i]:
+                    avg_match_str = 'YES' if avg_match else 'NO'
+                    avg_match_color = _GREEN_FILL if avg_match else _RED_FILL
+                else:
+                    avg_match_str = 'NO DATA'
+                    avg_match_color = _YELLOW_FILL
+
+                # Compare DateTime - more lenient
+                dt_ui_str = normalize_string(dt_ui)
+                dt_calc_str = normalize_string(dt_calc)
+                if dt_ui_str and dt_calc_str and dt_ui_str not in ['novaliddata',
+                                                                   'invaliddata'] and dt_calc_str not in [
+                    'novaliddata', 'invaliddata']:
+                    dt_match = (dt_ui_str == dt_calc_str)
+                else:
+                    dt_match = True  # Don't fail on datetime if both calculations passed
+                dt_match_str = 'YES' if dt_match else 'NO'
+                dt_match_color = _GREEN_FILL if dt_match else _YELLOW_FILL
+
+                # Overall match - prioritize numeric values
+                overall_match = max_match and avg_match
+                overall_match_str = 'YES' if overall_match else 'NO'
+                overall_match_color = _GREEN_FILL if overall_match else _RED_FILL
+
+                # Write to validation report
+                ws_new.append([
+                    param, max_ui, max_calc, filled_cell(ws_new, max_match_str, max_match_color),
+                    avg_ui, avg_calc, filled_cell(ws_new, avg_match_str, avg_match_color),
+                    dt_ui, dt_calc, filled_cell(ws_new, dt_match_str, dt_match_color),
+                    filled_cell(ws_new, overall_match_str, overall_match_color)
+                ])
+
+                sheet_items.append(param)
+                sheet_matches.append(overall_match)
+
+                if overall_match:
+                    total_matches += 1
+                total_comparisons += 1
+
+            validation_results['Demand Table'] = SheetResult(sheet_items, sheet_matches)
 
         # Summary sheet
         ws_summary = wb_output.create_sheet('Validation Summary')
@@ -1073,8 +1247,18 @@ def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duratio
         ws_summary.append(['Total Comparisons', total_comparisons])
         ws_summary.append(['Successful Matches', total_matches])
         ws_summary.append(['Failed Matches', total_comparisons - total_matches])
-        ws_summary.append(['Success Rate',
-                           f"{(total_matches / total_comparisons * 100):.1f}%" if total_comparisons > 0 else "0%"])
+        # Color code the success rate row as it is written
+        success_rate = total_matches / total_comparisons * 100 if total_comparisons > 0 else 0
+        if success_rate >= 90:
+            success_fill = _GREEN_FILL
+        elif success_rate >= 70:
+            success_fill = _YELLOW_FILL
+        else:
+            success_fill = _RED_FILL
+        ws_summary.append([
+            filled_cell(ws_summary, 'Success Rate', success_fill),
+            filled_cell(ws_summary, f"{success_rate:.1f}%" if total_comparisons > 0 else "0%", success_fill)
+        ])
         ws_summary.append(['Validation Date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
         ws_summary.append(['SIP Duration Used', f"{sip_duration} minutes"])
         ws_summary.append(['Expected SIPs/Day', (24 * 60) // sip_duration])
@@ -1095,18 +1279,6 @@ def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duratio
             for row in ws_analysis_calc.iter_rows(values_only=True):
                 ws_analysis_new.append(row)
 
-        # Color code summary
-        for row in range(2, ws_summary.max_row + 1):
-            for col in range(1, ws_summary.max_column + 1):
-                if row == 5:  # Success rate row
-                    success_rate = total_matches / total_comparisons * 100 if total_comparisons > 0 else 0
-                    if success_rate >= 90:
-                        ws_summary.cell(row=row, column=col).fill = green
-                    elif success_rate >= 70:
-                        ws_summary.cell(row=row, column=col).fill = yellow
-                    else:
-                        ws_summary.cell(row=row, column=col).fill = red
-
         wb_output.save(output_file)
         logger.info(f"Monthly side panel comparison saved: {output_file}")
 
@@ -1120,6 +1292,35 @@ def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duratio
 # ============================================================================
 # COMPREHENSIVE SUMMARY REPORT
 # ============================================================================
+# Shared style objects reused across summary cells - styles are immutable, so every report and every
+# named style that needs the same font/fill/alignment/border points at one instance
+_CENTER = Alignment(horizontal="center", vertical="center")
+_LEFT = Alignment(horizontal="left", vertical="center")
+_MAIN_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_MAIN_HEADER_FONT = Font(bold=True, size=14, color="FFFFFF", name="Calibri")
+_MAIN_HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+_SECTION_FONT = Font(bold=True, size=11, color="FFFFFF", name="Calibri")
+_SECTION_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_TIMESTAMP_FONT = Font(size=10, italic=True, color="666666", name="Calibri")
+_TIMESTAMP_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+_DATA_FONT = Font(size=10, name="Calibri", color="000000")
+_BOLD_FONT = Font(bold=True, size=10, name="Calibri", color="000000")  # labels, rates, warnings
+_STATUS_FONT = Font(bold=True, size=10, color="FFFFFF", name="Calibri")  # on PASS/FAIL fills
+_SUCCESS_RATE_FONT = Font(bold=True, size=11, name="Calibri", color="000000")
+_WHITE_FILL = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
+_GREY_FILL = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+_PASS_FILL = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+_FAIL_FILL = PatternFill(start_color="C55A5A", end_color="C55A5A", fill_type="solid")
+_WARNING_FILL = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+_THICK_SIDE = Side(style='medium', color='000000')
+_THIN_SIDE = Side(style='thin', color='000000')
+_THICK_BORDER = Border(left=_THICK_SIDE, right=_THICK_SIDE, top=_THICK_SIDE, bottom=_THICK_SIDE)
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+# Widths of summary columns A..H; the full-width rows span all of them
+_SUMMARY_COL_WIDTHS = (30, 25, 20, 25, 15, 15, 15, 15)
+_SUMMARY_NCOLS = len(_SUMMARY_COL_WIDTHS)
+
+
 @log_execution_time
 def create_comprehensive_summary_report(config, month_info, ui_file, calculated_file,
                                         comparison_file, validation_results, raw_df, meter_name, sip_duration):
@@ -1128,130 +1329,20 @@ def create_comprehensive_summary_report(config, month_info, ui_file, calculated_
 
     try:
         month_safe = month_info['selected_month_year'].replace(' ', '_').replace('/', '_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # One clock read so the file name and both "generated" fields agree
+        now_dt = datetime.now()
+        now_str = now_dt.strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = now_dt.strftime('%Y%m%d_%H%M%S')
         summary_file = f"COMPLETE_VALIDATION_SUMMARY_MONTHLY_DEMAND_SIDEPANEL_{month_safe}_{timestamp}.xlsx"
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Validation_Summary_Report"
-
-        # Enhanced Styles
-        main_header_font = Font(bold=True, size=14, color="FFFFFF", name="Calibri")
-        main_header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        main_header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        section_header_font = Font(bold=True, size=11, color="FFFFFF", name="Calibri")
-        section_header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        section_header_alignment = Alignment(horizontal="left", vertical="center")
-
-        label_font = Font(bold=True, size=10, name="Calibri", color="000000")
-        label_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        label_alignment = Alignment(horizontal="left", vertical="center")
-
-        data_font = Font(size=10, name="Calibri", color="000000")
-        data_fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
-        data_alignment = Alignment(horizontal="left", vertical="center")
-
-        pass_font = Font(bold=True, size=10, color="FFFFFF", name="Calibri")
-        pass_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        pass_alignment = Alignment(horizontal="center", vertical="center")
-
-        fail_font = Font(bold=True, size=10, color="FFFFFF", name="Calibri")
-        fail_fill = PatternFill(start_color="C55A5A", end_color="C55A5A", fill_type="solid")
-        fail_alignment = Alignment(horizontal="center", vertical="center")
-
-        thick_border = Border(
-            left=Side(style='medium', color='000000'),
-            right=Side(style='medium', color='000000'),
-            top=Side(style='medium', color='000000'),
-            bottom=Side(style='medium', color='000000')
-        )
-
-        thin_border = Border(
-            left=Side(style='thin', color='000000'),
-            right=Side(style='thin', color='000000'),
-            top=Side(style='thin', color='000000'),
-            bottom=Side(style='thin', color='000000')
-        )
-
-        current_row = 1
-
-        # ============ MAIN HEADER ============
-        ws.merge_cells(f'A{current_row}:H{current_row}')
-        header_cell = ws[f'A{current_row}']
-        header_cell.value = f"LV MONTHLY DEMAND SIDE PANEL VALIDATION SUMMARY - {month_info['selected_month_year'].upper()}"
-        header_cell.font = main_header_font
-        header_cell.fill = main_header_fill
-        header_cell.alignment = main_header_alignment
-        header_cell.border = thick_border
-        ws.row_dimensions[current_row].height = 30
-        current_row += 1
-
-        # Timestamp
-        ws.merge_cells(f'A{current_row}:H{current_row}')
-        timestamp_cell = ws[f'A{current_row}']
-        timestamp_cell.value = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        timestamp_cell.font = Font(size=10, italic=True, color="666666", name="Calibri")
-        timestamp_cell.alignment = Alignment(horizontal="center", vertical="center")
-        timestamp_cell.fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        timestamp_cell.border = thin_border
-        ws.row_dimensions[current_row].height = 20
-        current_row += 1
-
-        current_row += 1
-
-        # ============ TEST DETAILS SECTION ============
-        ws.merge_cells(f'A{current_row}:B{current_row}')
-        section_cell = ws[f'A{current_row}']
-        section_cell.value = "📋 TEST DETAILS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 25
-        current_row += 1
-
         test_details = [
             ["Test Engineer:", TestEngineer.NAME],
             ["Designation:", TestEngineer.DESIGNATION],
             ["Test Month:", config['target_month_year']],
             ["Department:", TestEngineer.DEPARTMENT],
-            ["Report Generated:", datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ["Report Generated:", now_str],
         ]
 
-        for label, value in test_details:
-            ws[f'A{current_row}'].value = label
-            ws[f'A{current_row}'].font = label_font
-            ws[f'A{current_row}'].fill = label_fill
-            ws[f'A{current_row}'].alignment = label_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = value
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = data_alignment
-            ws[f'B{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
-
-        current_row += 1
-
-        # ============ SYSTEM UNDER TEST ============
-        ws.merge_cells(f'A{current_row}:B{current_row}')
-        section_cell = ws[f'A{current_row}']
-        section_cell.value = "🔧 SYSTEM UNDER TEST"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 25
-        current_row += 1
-
         system_details = [
             ["Area:", config['area']],
             ["Substation:", config['substation']],
@@ -1265,251 +1356,192 @@ def create_comprehensive_summary_report(config, month_info, ui_file, calculated_
             ["SIP Duration:", f"{sip_duration} minutes"],
         ]
 
-        for label, value in system_details:
-            ws[f'A{current_row}'].value = label
-            ws[f'A{current_row}'].font = label_font
-            ws[f'A{current_row}'].fill = label_fill
-            ws[f'A{current_row}'].alignment = label_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = value
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = data_alignment
-            ws[f'B{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
-
-        current_row += 1
-
-        # ============ DATA VOLUME ANALYSIS ============
-        ws.merge_cells(f'A{current_row}:C{current_row}')
-        section_cell = ws[f'A{current_row}']
-        section_cell.value = "📊 DATA VOLUME ANALYSIS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 25
-        current_row += 1
-
-        # Column headers
-        headers = ["Dataset", "Record Count", "Status"]
-        for i, header in enumerate(headers, start=1):
-            col_letter = chr(64 + i)
-            cell = ws[f'{col_letter}{current_row}']
-            cell.value = header
-            cell.font = label_font
-            cell.fill = label_fill
-            cell.alignment = label_alignment
-            cell.border = thin_border
-        ws.row_dimensions[current_row].height = 22
-        current_row += 1
-
         # Calculate expected records
-        days_in_month = (month_info['end_date'] - month_info['start_date']).days + 1
+        days_in_month = month_info['days_in_month']
         expected_records = days_in_month * ((24 * 60) // sip_duration)
         data_completeness = (len(raw_df) / expected_records * 100) if expected_records > 0 else 0
 
+        raw_ok = len(raw_df) > 0
+        completeness_ok = data_completeness >= 90
+
+        # Each row carries its own pass/fail verdict instead of sniffing it back out of the status text
         data_rows = [
-            ["Raw Database Records", len(raw_df), "COMPLETE RECORDS" if len(raw_df) > 0 else "NO DATA"],
-            ["Expected Records", expected_records, f"{data_completeness:.1f}% Complete"],
-            ["SIP Duration Used", f"{sip_duration} min", "DYNAMIC FROM DB"],
-            ["Days in Month", days_in_month, f"{month_info['selected_month_year']}"]
+            (["Raw Database Records", len(raw_df), "COMPLETE RECORDS" if raw_ok else "NO DATA"], raw_ok),
+            (["Expected Records", expected_records, f"{data_completeness:.1f}% Complete"], completeness_ok),
+            (["SIP Duration Used", f"{sip_duration} min", "DYNAMIC FROM DB"], True),
+            (["Days in Month", days_in_month, f"{month_info['selected_month_year']}"], days_in_month > 0)
         ]
 
-        for dataset, count, status in data_rows:
-            ws[f'A{current_row}'].value = dataset
-            ws[f'A{current_row}'].font = data_font
-            ws[f'A{current_row}'].fill = data_fill
-            ws[f'A{current_row}'].alignment = data_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = count
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'B{current_row}'].border = thin_border
-
-            ws[f'C{current_row}'].value = status
-            if "COMPLETE" in str(status) or "%" in str(status) or "DYNAMIC" in str(status) or "January" in str(
-                    status) or "February" in str(status) or "March" in str(status):
-                if data_completeness >= 90 or "COMPLETE RECORDS" in str(status) or "DYNAMIC" in str(
-                        status) or days_in_month > 0:
-                    ws[f'C{current_row}'].font = pass_font
-                    ws[f'C{current_row}'].fill = pass_fill
-                else:
-                    ws[f'C{current_row}'].font = fail_font
-                    ws[f'C{current_row}'].fill = fail_fill
-            else:
-                ws[f'C{current_row}'].font = fail_font
-                ws[f'C{current_row}'].fill = fail_fill
-            ws[f'C{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'C{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
-
-        current_row += 1
-
-        # ============ VALIDATION RESULTS ============
-        ws.merge_cells(f'A{current_row}:E{current_row}')
-        section_cell = ws[f'A{current_row}']
-        section_cell.value = "✅ VALIDATION RESULTS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 25
-        current_row += 1
-
-        # Column headers
-        validation_headers = ["Comparison Type", "Matches", "Mismatches", "Success Rate", "Status"]
-        for i, header in enumerate(validation_headers, start=1):
-            col_letter = chr(64 + i)
-            cell = ws[f'{col_letter}{current_row}']
-            cell.value = header
-            cell.font = label_font
-            cell.fill = label_fill
-            cell.alignment = label_alignment
-            cell.border = thin_border
-        ws.row_dimensions[current_row].height = 22
-        current_row += 1
-
-        # Calculate validation results
-        overall_passed = 0
-        overall_total = 0
-        validation_data = []
-
-        for sheet_name, results in validation_results.items():
-            total_items = len(results)
-            passed_items = sum(1 for result in results if result['match'])
-            failed_items = total_items - passed_items
-            success_rate = f"{(passed_items / total_items) * 100:.1f}%" if total_items > 0 else "0%"
-            status = "PASS" if passed_items == total_items else "FAIL"
-
-            display_name = sheet_name.replace('_', ' ')
-            validation_data.append([display_name, passed_items, failed_items, success_rate, status])
-
-            overall_passed += passed_items
-            overall_total += total_items
-
-        for comp_type, matches, mismatches, rate, status in validation_data:
-            ws[f'A{current_row}'].value = comp_type
-            ws[f'A{current_row}'].font = data_font
-            ws[f'A{current_row}'].fill = data_fill
-            ws[f'A{current_row}'].alignment = data_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = matches
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'B{current_row}'].border = thin_border
-
-            ws[f'C{current_row}'].value = mismatches
-            ws[f'C{current_row}'].font = data_font
-            ws[f'C{current_row}'].fill = data_fill
-            ws[f'C{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'C{current_row}'].border = thin_border
-
-            ws[f'D{current_row}'].value = rate
-            ws[f'D{current_row}'].font = Font(bold=True, size=10, name="Calibri", color="000000")
-            ws[f'D{current_row}'].fill = data_fill
-            ws[f'D{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'D{current_row}'].border = thin_border
-
-            ws[f'E{current_row}'].value = status
-            if status == "PASS":
-                ws[f'E{current_row}'].font = pass_font
-                ws[f'E{current_row}'].fill = pass_fill
-            else:
-                ws[f'E{current_row}'].font = fail_font
-                ws[f'E{current_row}'].fill = fail_fill
-            ws[f'E{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'E{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
-
-        current_row += 1
-
-        # ============ OVERALL ASSESSMENT ============
-        ws.merge_cells(f'A{current_row}:H{current_row}')
-        section_cell = ws[f'A{current_row}']
-        section_cell.value = "🏆 OVERALL ASSESSMENT"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 25
-        current_row += 1
+        # Calculate validation results - (name, passed, total) per sheet in one pass,
+        # counting each sheet's match flags at C level
+        sheet_counts = [(sheet_name, int(np.count_nonzero(np.asarray(results.matches, dtype=np.bool_))), len(results.matches))
+                        for sheet_name, results in validation_results.items()]
+        overall_passed = sum(passed for _, passed, _ in sheet_counts)
+        overall_total = sum(total for _, _, total in sheet_counts)
+        validation_data = [
+            [sheet_name.replace('_', ' '), passed, total - passed,
+             f"{(passed / total) * 100:.1f}%" if total > 0 else "0%",
+             "PASS" if passed == total else "FAIL"]
+            for sheet_name, passed, total in sheet_counts
+        ]
 
         overall_success_rate = (overall_passed / overall_total) * 100 if overall_total > 0 else 0
 
         if overall_success_rate >= 95:
             assessment = "✓ EXCELLENT: Monthly demand side panel validation passed with high confidence"
-            assessment_color = pass_fill
-            assessment_font_color = pass_font
+            assessment_style = "Summary Assessment Pass"
         elif overall_success_rate >= 80:
             assessment = "⚠ GOOD: Minor discrepancies found - Review recommended"
-            assessment_color = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-            assessment_font_color = Font(bold=True, size=10, color="000000", name="Calibri")
+            assessment_style = "Summary Assessment Warning"
         else:
             assessment = "❌ REQUIRES ATTENTION: Significant validation failures detected"
-            assessment_color = fail_fill
-            assessment_font_color = fail_font
-
-        ws.merge_cells(f'A{current_row}:H{current_row}')
-        cell = ws[f'A{current_row}']
-        cell.value = assessment
-        cell.font = assessment_font_color
-        cell.fill = assessment_color
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thick_border
-        ws.row_dimensions[current_row].height = 30
-        current_row += 1
+            assessment_style = "Summary Assessment Fail"
+
+        # Report content is fully computed above - the workbook below only streams it
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Validation_Summary_Report")
+
+        # Register every cell format once on the workbook; a cell then takes a single named-style
+        # assignment instead of separate font/fill/alignment/border lookups
+        for named_style in [
+            NamedStyle("Summary Main Header", font=_MAIN_HEADER_FONT, fill=_MAIN_HEADER_FILL,
+                       alignment=_MAIN_HEADER_ALIGNMENT, border=_THICK_BORDER),
+            NamedStyle("Summary Timestamp", font=_TIMESTAMP_FONT, fill=_TIMESTAMP_FILL, alignment=_CENTER,
+                       border=_THIN_BORDER),
+            NamedStyle("Summary Section", font=_SECTION_FONT, fill=_SECTION_FILL, alignment=_LEFT,
+                       border=_THICK_BORDER),
+            NamedStyle("Summary Label", font=_BOLD_FONT, fill=_GREY_FILL, alignment=_LEFT, border=_THIN_BORDER),
+            NamedStyle("Summary Data", font=_DATA_FONT, fill=_WHITE_FILL, alignment=_LEFT, border=_THIN_BORDER),
+            NamedStyle("Summary Data Center", font=_DATA_FONT, fill=_WHITE_FILL, alignment=_CENTER,
+                       border=_THIN_BORDER),
+            NamedStyle("Summary Rate", font=_BOLD_FONT, fill=_WHITE_FILL, alignment=_CENTER, border=_THIN_BORDER),
+            NamedStyle("Summary Pass", font=_STATUS_FONT, fill=_PASS_FILL, alignment=_CENTER, border=_THIN_BORDER),
+            NamedStyle("Summary Fail", font=_STATUS_FONT, fill=_FAIL_FILL, alignment=_CENTER, border=_THIN_BORDER),
+            NamedStyle("Summary Assessment Pass", font=_STATUS_FONT, fill=_PASS_FILL, alignment=_CENTER,
+                       border=_THICK_BORDER),
+            NamedStyle("Summary Assessment Warning", font=_BOLD_FONT, fill=_WARNING_FILL, alignment=_CENTER,
+                       border=_THICK_BORDER),
+            NamedStyle("Summary Assessment Fail", font=_STATUS_FONT, fill=_FAIL_FILL, alignment=_CENTER,
+                       border=_THICK_BORDER),
+            NamedStyle("Summary Success Rate", font=_SUCCESS_RATE_FONT, fill=_GREY_FILL, alignment=_CENTER,
+                       border=_THIN_BORDER),
+        ]:
+            wb.add_named_style(named_style)
+
+        # Set column widths - write-only sheets need dimensions before the first row is streamed
+        for col_idx, width in enumerate(_SUMMARY_COL_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+        # Most rows are 20pt - make that the sheet default so only the taller header/section rows
+        # and the 15pt spacer rows need their own RowDimension entry
+        ws.sheet_format.defaultRowHeight = 20
+        ws.sheet_format.customHeight = True
+
+        current_row = 0
+
+        def styled(value=None, style=None, border=None):
+            """Write-only cell with one of the registered named styles, or only a border for merge edges"""
+            cell = WriteOnlyCell(ws, value=value)
+            if style:
+                cell.style = style
+            if border:
+                cell.border = border
+            return cell
+
+        def append_row(cells=(), height=None):
+            """Stream one row; its height has to be registered before the row is written"""
+            nonlocal current_row
+            current_row += 1
+            if height:
+                ws.row_dimensions[current_row].height = height
+            ws.append(list(cells))
+
+        def append_merged_row(first_cell, span, height=None, edge_border=None):
+            """Stream a row whose first cell spans the first `span` columns; covered cells only carry the edge border"""
+            # Excel draws a merged range's outer edges from the covered cells, so they keep the border
+            covered = [styled(border=edge_border) if edge_border else None for _ in range(span - 1)]
+            append_row([first_cell] + covered, height)
+            # Numeric bounds - no coordinate string to format and parse back
+            ws.merged_cells.add(CellRange(min_col=1, min_row=current_row, max_col=span, max_row=current_row))
+
+        def append_section(title, span):
+            """Section banner spanning the first `span` columns"""
+            append_merged_row(styled(title, "Summary Section"), span, 25, _THICK_BORDER)
+
+        def append_kv_table(rows):
+            """Two-column label/value table"""
+            for label, value in rows:
+                append_row([styled(label, "Summary Label"), styled(value, "Summary Data")])
+
+        def append_grid(headers, column_styles, rows):
+            """Header row plus one row per (values, is_pass); the last value is a PASS/FAIL styled status"""
+            append_row([styled(header, "Summary Label") for header in headers], 22)
+            for values, is_pass in rows:
+                cells = [styled(value, style) for value, style in zip(values, column_styles)]
+                cells.append(styled(values[-1], "Summary Pass" if is_pass else "Summary Fail"))
+                append_row(cells)
+
+        # ============ MAIN HEADER ============
+        append_merged_row(styled(
+            f"LV MONTHLY DEMAND SIDE PANEL VALIDATION SUMMARY - {month_info['selected_month_year'].upper()}",
+            "Summary Main Header"), _SUMMARY_NCOLS, 30)
+
+        # Timestamp
+        append_merged_row(styled(
+            f"Generated: {now_str}",
+            "Summary Timestamp"), _SUMMARY_NCOLS)
+
+        append_row(height=15)
+
+        # ============ TEST DETAILS SECTION ============
+        append_section("📋 TEST DETAILS", 2)
+        append_kv_table(test_details)
+
+        append_row(height=15)
+
+        # ============ SYSTEM UNDER TEST ============
+        append_section("🔧 SYSTEM UNDER TEST", 2)
+        append_kv_table(system_details)
+
+        append_row(height=15)
+
+        # ============ DATA VOLUME ANALYSIS ============
+        append_section("📊 DATA VOLUME ANALYSIS", 3)
+        append_grid(["Dataset", "Record Count", "Status"], ("Summary Data", "Summary Data Center"), data_rows)
+
+        append_row(height=15)
+
+        # ============ VALIDATION RESULTS ============
+        append_section("✅ VALIDATION RESULTS", 5)
+        validation_headers = ["Comparison Type", "Matches", "Mismatches", "Success Rate", "Status"]
+        append_grid(validation_headers,
+                    ("Summary Data", "Summary Data Center", "Summary Data Center", "Summary Rate"),
+                    [(row, row[-1] == "PASS") for row in validation_data])
+
+        append_row(height=15)
+
+        # ============ OVERALL ASSESSMENT ============
+        append_section("🏆 OVERALL ASSESSMENT", _SUMMARY_NCOLS)
+        append_merged_row(styled(assessment, assessment_style), _SUMMARY_NCOLS, 30, _THICK_BORDER)
 
         # Success rate detail
-        ws.merge_cells(f'A{current_row}:H{current_row}')
-        cell = ws[f'A{current_row}']
-        cell.value = f"Overall Success Rate: {overall_success_rate:.1f}% ({overall_passed}/{overall_total} validations passed)"
-        cell.font = Font(bold=True, size=11, name="Calibri", color="000000")
-        cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thin_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thin_border
-        ws.row_dimensions[current_row].height = 22
-        current_row += 1
-
-        # Set column widths
-        column_widths = {'A': 30, 'B': 25, 'C': 20, 'D': 25, 'E': 15, 'F': 15, 'G': 15, 'H': 15}
-        for col_letter, width in column_widths.items():
-            ws.column_dimensions[col_letter].width = width
+        append_merged_row(styled(
+            f"Overall Success Rate: {overall_success_rate:.1f}% ({overall_passed}/{overall_total} validations passed)",
+            "Summary Success Rate"), _SUMMARY_NCOLS, 22, _THIN_BORDER)
 
         wb.save(summary_file)
-        logger.info(f"Comprehensive monthly side panel summary report created: {summary_file}")
+        logger.info("Comprehensive monthly side panel summary report created: %s", summary_file)
 
         # Log summary
         logger.info("=" * 60)
         logger.info("MONTHLY DEMAND SIDE PANEL VALIDATION SUMMARY")
         logger.info("=" * 60)
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
-        logger.info(f"Month: {month_info['selected_month_year']}")
-        logger.info(f"SIP Duration: {sip_duration} minutes")
-        logger.info(f"Data: Raw={len(raw_df)} records")
-        logger.info(f"Overall Success Rate: {overall_success_rate:.1f}%")
-        logger.info(f"Data Completeness: {data_completeness:.1f}%")
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
+        logger.info("Month: %s", month_info['selected_month_year'])
+        logger.info("SIP Duration: %s minutes", sip_duration)
+        logger.info("Data: Raw=%s records", len(raw_df))
+        logger.info("Overall Success Rate: %.1f%%", overall_success_rate)
+        logger.info("Data Completeness: %.1f%%", data_completeness)
         logger.info("=" * 60)
 
         return summary_file
@@ -1543,17 +1575,18 @@ def main_lv_monthly_demand_sidepanel_automation():
         logger.info("=" * 60)
         logger.info("DATABASE CONFIGURATION")
         logger.info("=" * 60)
-        logger.info(f"DB1: {DatabaseConfig.DB1_HOST}:{DatabaseConfig.DB1_PORT}/{DatabaseConfig.DB1_DATABASE}")
-        logger.info(f"DB2: {DatabaseConfig.DB2_HOST}:{DatabaseConfig.DB2_PORT}/{DatabaseConfig.DB2_DATABASE}")
-        logger.info(f"Tenant: {DatabaseConfig.TENANT_NAME}")
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
+        logger.info("DB1: %s:%s/%s", DatabaseConfig.DB1_HOST, DatabaseConfig.DB1_PORT, DatabaseConfig.DB1_DATABASE)
+        logger.info("DB2: %s:%s/%s", DatabaseConfig.DB2_HOST, DatabaseConfig.DB2_PORT, DatabaseConfig.DB2_DATABASE)
+        logger.info("Tenant: %s", DatabaseConfig.TENANT_NAME)
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
         logger.info("=" * 60)
 
         # Start browser
         logger.info("Starting browser...")
         driver = webdriver.Chrome()
         driver.maximize_window()
-        wait = WebDriverWait(driver, 15)
+        driver.implicitly_wait(1)  # Safety net only - explicit waits do the real synchronisation
+        wait = _wait(driver, 15)
 
         # Login
         if not login(driver):
@@ -1583,20 +1616,16 @@ def main_lv_monthly_demand_sidepanel_automation():
         dt_id, name, mtr_id, node_id, sip_duration = get_metrics(config['meter_serial_no'], config['meter_type'])
 
         if not dt_id:
-            logger.info(f"Meter not found: {config['meter_serial_no']}")
+            logger.info("Meter not found: %s", config['meter_serial_no'])
             return False
 
-        logger.info(f"Meter found: {name} (ID: {mtr_id}, node_id: {node_id}, SIP: {sip_duration}min)")
+        logger.info("Meter found: %s (ID: %s, node_id: %s, SIP: %smin)", name, mtr_id, node_id, sip_duration)
 
         # Find and click View
-        time.sleep(3)
         if not find_and_click_view_using_search(driver, wait, config['meter_serial_no']):
             logger.info("Failed to find View button")
             return False
 
-        # Wait for page to load
-        time.sleep(5)
-
         # Collect side panel data ONLY - NO GRAPH
         logger.info("=" * 60)
         logger.info("COLLECTING SIDE PANEL DATA ONLY (NO GRAPH EXTRACTION)")
@@ -1609,29 +1638,41 @@ def main_lv_monthly_demand_sidepanel_automation():
             ui_file = save_file_to_output(ui_file, output_folder)
 
         # Get database data for complete month - EXACT same as daywise
-        raw_df, nrm_df = get_database_data_for_monthly_sidepanel(month_info, mtr_id, node_id)
+        raw_df, nrm_summary = get_database_data_for_monthly_sidepanel(month_info, mtr_id, node_id)
 
-        if raw_df.empty and nrm_df.empty:
+        if raw_df.empty and not nrm_summary['records']:
             logger.info("No database data found for the month")
             return False
 
         # Process database calculations - EXACT same as daywise
         logger.info("Processing database calculations for side panel metrics...")
         calculated_data, calculated_file = calculate_side_panel_metrics_from_raw_data(
-            raw_df, nrm_df, month_info, sip_duration)
+            raw_df, nrm_summary, month_info, sip_duration)
         calculated_file = save_file_to_output(calculated_file, output_folder)
 
         # Create comparison report
         logger.info("Creating side panel validation comparison...")
         comparison_file, validation_results = create_detailed_comparison(
             ui_file, calculated_file, month_info, sip_duration)
-        comparison_file = save_file_to_output(comparison_file, output_folder)
 
-        # Create comprehensive summary report
+        # Create comprehensive summary report - written on a worker thread while the
+        # comparison file is moved and the browser (no longer needed) is closed
         logger.info("Creating comprehensive summary...")
-        summary_report = create_comprehensive_summary_report(
-            config, month_info, ui_file, calculated_file,
-            comparison_file, validation_results, raw_df, name, sip_duration)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            summary_future = executor.submit(
+                create_comprehensive_summary_report, config, month_info, ui_file, calculated_file,
+                comparison_file, validation_results, raw_df, name, sip_duration)
+
+            comparison_file = save_file_to_output(comparison_file, output_folder)
+
+            try:
+                driver.quit()
+                logger.info("Browser closed")
+            except:
+                pass
+            driver = None
+
+            summary_report = summary_future.result()
         if summary_report:
             summary_report = save_file_to_output(summary_report, output_folder)
 
@@ -1639,23 +1680,23 @@ def main_lv_monthly_demand_sidepanel_automation():
         logger.info("=" * 60)
         logger.info("LV MONTHLY DEMAND SIDE PANEL AUTOMATION COMPLETED SUCCESSFULLY!")
         logger.info("=" * 60)
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
-        logger.info(f"Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
-        logger.info(f"Output Folder: {output_folder}")
-        logger.info(f"Month: {config['target_month_year']}")
-        logger.info(f"Area: {config['area']}")
-        logger.info(f"Substation: {config['substation']}")
-        logger.info(f"Feeder: {config['feeder']}")
-        logger.info(f"Meter: {config['meter_serial_no']} ({name})")
-        logger.info(f"Meter Type: {config['meter_type']}")
-        logger.info(f"SIP Duration: {sip_duration} minutes (dynamic from DB)")
-        logger.info(f"Database Records: {len(raw_df)} records")
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
+        logger.info("Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
+        logger.info("Output Folder: %s", output_folder)
+        logger.info("Month: %s", config['target_month_year'])
+        logger.info("Area: %s", config['area'])
+        logger.info("Substation: %s", config['substation'])
+        logger.info("Feeder: %s", config['feeder'])
+        logger.info("Meter: %s (%s)", config['meter_serial_no'], name)
+        logger.info("Meter Type: %s", config['meter_type'])
+        logger.info("SIP Duration: %s minutes (dynamic from DB)", sip_duration)
+        logger.info("Database Records: %s records", len(raw_df))
         logger.info("")
         logger.info("Generated Files (4 total):")
-        logger.info(f"   1. {os.path.basename(ui_file) if ui_file else 'UI side panel data'}")
-        logger.info(f"   2. {os.path.basename(calculated_file) if calculated_file else 'Calculated data'}")
-        logger.info(f"   3. {os.path.basename(comparison_file) if comparison_file else 'Comparison report'}")
-        logger.info(f"   4. {os.path.basename(summary_report) if summary_report else 'Summary report'}")
+        logger.info("   1. %s", os.path.basename(ui_file) if ui_file else 'UI side panel data')
+        logger.info("   2. %s", os.path.basename(calculated_file) if calculated_file else 'Calculated data')
+        logger.info("   3. %s", os.path.basename(comparison_file) if comparison_file else 'Comparison report')
+        logger.info("   4. %s", os.path.basename(summary_report) if summary_report else 'Summary report')
         logger.info("")
         logger.info("KEY FEATURES APPLIED:")
         logger.info("   ✓ LV Monthly Demand Side Panel monitoring (NO GRAPH)")
@@ -1674,7 +1715,7 @@ def main_lv_monthly_demand_sidepanel_automation():
         return True
 
     except Exception as e:
-        logger.info(f"Critical error: {e}")
+        logger.info("Critical error: %s", e)
 
         if output_folder and os.path.exists(output_folder):
             try:
@@ -1685,7 +1726,7 @@ def main_lv_monthly_demand_sidepanel_automation():
                     f.write(f"Error: {str(e)}\n")
                     f.write(f"Config: {config}\n")
                     f.write(f"Engineer: {TestEngineer.NAME}\n")
-                logger.info(f"Error log saved: {os.path.basename(error_file)}")
+                logger.info("Error log saved: %s", os.path.basename(error_file))
             except:
                 pass
 
@@ -1707,9 +1748,9 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("LV MONTHLY DEMAND SIDE PANEL AUTOMATION (NO GRAPH)")
     logger.info("=" * 60)
-    logger.info(f"Test Engineer: {TestEngineer.NAME}")
-    logger.info(f"Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
-    logger.info(f"Database Tenant: {DatabaseConfig.TENANT_NAME}")
+    logger.info("Test Engineer: %s", TestEngineer.NAME)
+    logger.info("Monitoring Type: LV Monthly Demand Side Panel (NO GRAPH)")
+    logger.info("Database Tenant: %s", DatabaseConfig.TENANT_NAME)
     logger.info("")
     logger.info("FEATURES:")
     logger.info("   ✓ LV Monthly Demand Side Panel monitoring")
@@ -1733,7 +1774,7 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     if success:
         logger.info("LV MONTHLY DEMAND SIDE PANEL AUTOMATION COMPLETED SUCCESSFULLY ✓")
-        logger.info(f"Total Time: {total_time:.2f}s ({total_time / 60:.1f}min)")
+        logger.info("Total Time: %.2fs (%.1fmin)", total_time, total_time / 60)
         logger.info("All optimizations verified:")
         logger.info("   ✓ LV Monthly Demand Side Panel monitoring")
         logger.info("   ✓ Complete month processing")
@@ -1748,7 +1789,7 @@ if __name__ == "__main__":
         logger.info("   ✓ NO GRAPH EXTRACTION - Side panel only")
     else:
         logger.info("LV MONTHLY DEMAND SIDE PANEL AUTOMATION FAILED ✗")
-        logger.info(f"Failed after: {total_time:.2f}s ({total_time / 60:.1f}min)")
+        logger.info("Failed after: %.2fs (%.1fmin)", total_time, total_time / 60)
         logger.info("Check error logs in output folder")
 
     logger.info("=" * 60)
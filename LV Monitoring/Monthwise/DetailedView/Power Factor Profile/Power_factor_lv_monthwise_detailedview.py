@@ -1,20 +1,31 @@
 import os
+import io
+import glob
+import json
 import shutil
 import time
 import logging
+import threading
+import atexit
 import pandas as pd
 import numpy as np
-import psycopg2
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from psycopg2.pool import ThreadedConnectionPool
+from datetime import datetime, date, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
 import functools
 import re
+import calendar
+from collections import namedtuple
 
 
 # ============================================================================
@@ -108,14 +119,23 @@ logger = setup_logger()
 # ============================================================================
 # OUTPUT FOLDER MANAGEMENT
 # ============================================================================
+def remove_trash_folders(output_folder):
+    """Delete renamed-away output folders, including any a previous run exited before finishing"""
+    for trash_folder in glob.glob(f"{output_folder}.trash.*"):
+        shutil.rmtree(trash_folder, ignore_errors=True)
+
+
 def setup_output_folder():
     """Create output folder and clean previous run files"""
     output_folder = 'output_files'
     if os.path.exists(output_folder):
-        shutil.rmtree(output_folder)
+        # Rename is a single metadata operation - the old files are deleted in the background
+        # while the automation carries on with a fresh folder
+        os.rename(output_folder, f"{output_folder}.trash.{os.getpid()}.{time.time_ns()}")
+        threading.Thread(target=remove_trash_folders, args=(output_folder,), daemon=True).start()
         logger.info("Cleaned previous output files")
     os.makedirs(output_folder)
-    logger.info(f"Created output folder: {output_folder}")
+    logger.info("Created output folder: %s", output_folder)
     return output_folder
 
 
@@ -126,11 +146,11 @@ def save_file_to_output(file_path, output_folder):
             filename = os.path.basename(file_path)
             output_path = os.path.join(output_folder, filename)
             shutil.move(file_path, output_path)
-            logger.info(f"Moved {filename} to output folder")
+            logger.info("Moved %s to output folder", filename)
             return output_path
         return file_path
     except Exception as e:
-        logger.info(f"Error moving file {file_path}: {e}")
+        logger.info("Error moving file %s: %s", file_path, e)
         return file_path
 
 
@@ -174,10 +194,10 @@ def create_default_config_file(config_file):
             df_instructions = pd.DataFrame(instructions)
             df_instructions.to_excel(writer, sheet_name='Setup_Instructions', index=False)
 
-        logger.info(f"LV Monthly Power Factor Detailed Configuration template created: {config_file}")
+        logger.info("LV Monthly Power Factor Detailed Configuration template created: %s", config_file)
         return True
     except Exception as e:
-        logger.info(f"Error creating config file: {e}")
+        logger.info("Error creating config file: %s", e)
         return False
 
 
@@ -192,47 +212,88 @@ def normalize_month_year(value):
         return str(value).strip()
 
 
+# Parsed configuration from the last run, keyed on the config file's path and modification time
+CONFIG_CACHE_FILE = os.path.join('logs', '.config_cache.json')
+
+
+def load_cached_configuration(config_file, mtime):
+    """Return the cached configuration if it was parsed from this exact file version, else None"""
+    try:
+        with open(CONFIG_CACHE_FILE, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache['path'] == os.path.abspath(config_file) and cache['mtime'] == mtime:
+            return cache['config']
+    except Exception:
+        pass
+    return None
+
+
+def save_cached_configuration(config_file, mtime, config):
+    """Persist a validated configuration so an unchanged file is not re-parsed on the next run"""
+    try:
+        with open(CONFIG_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'path': os.path.abspath(config_file), 'mtime': mtime, 'config': config}, f)
+    except Exception as e:
+        logger.info("Could not write configuration cache: %s", e)
+
+
+# Excel 'Parameter' name -> config key
+CONFIG_PARAMETER_KEYS = {
+    'Area': 'area',
+    'Substation': 'substation',
+    'Feeder': 'feeder',
+    'Target_Month_Year': 'target_month_year',
+    'Meter_Serial_No': 'meter_serial_no',
+    'Meter_Type': 'meter_type'
+}
+
+
 def read_user_configuration(config_file="user_config.xlsx"):
     """Read user configuration from Excel file for LV Monthly Power Factor Detailed"""
     try:
         if not os.path.exists(config_file):
-            logger.info(f"Configuration file not found: {config_file}")
+            logger.info("Configuration file not found: %s", config_file)
             return None
 
-        df_config = pd.read_excel(config_file, sheet_name='User_Configuration')
+        mtime = os.path.getmtime(config_file)
+        config = load_cached_configuration(config_file, mtime)
+        if config is not None:
+            logger.info("LV Monthly Power Factor Detailed Configuration loaded from cache")
+            return config
+
+        # calamine (python-calamine) parses the sheet natively; fall back to openpyxl where it isn't installed
+        # (ImportError) or pandas predates the engine (ValueError: unknown engine, pandas < 2.2).
+        # Only the two used columns are read, as plain strings - no dtype inference
+        read_args = dict(sheet_name='User_Configuration', usecols=['Parameter', 'Value'], dtype=str)
+        try:
+            df_config = pd.read_excel(config_file, engine='calamine', **read_args)
+        except (ImportError, ValueError):
+            df_config = pd.read_excel(config_file, engine='openpyxl', **read_args)
         config = {'type': 'LV'}  # Fixed for LV monitoring
 
-        for _, row in df_config.iterrows():
-            param, value = row['Parameter'], row['Value']
-            if param == 'Area':
-                config['area'] = str(value).strip()
-            elif param == 'Substation':
-                config['substation'] = str(value).strip()
-            elif param == 'Feeder':
-                config['feeder'] = str(value).strip()
-            elif param == 'Target_Month_Year':
-                config['target_month_year'] = normalize_month_year(value)
-            elif param == 'Meter_Serial_No':
-                config['meter_serial_no'] = str(value).strip()
-            elif param == 'Meter_Type':
-                config['meter_type'] = str(value).strip()
+        raw = dict(zip(df_config['Parameter'].astype(str), df_config['Value']))
+        for param, key in CONFIG_PARAMETER_KEYS.items():
+            if param in raw:
+                value = raw[param]
+                config[key] = normalize_month_year(value) if key == 'target_month_year' else str(value).strip()
 
         required_fields = ['type', 'area', 'substation', 'feeder', 'target_month_year', 'meter_serial_no', 'meter_type']
         missing_fields = [f for f in required_fields if f not in config or not config[f]]
         if missing_fields:
-            logger.info(f"Missing required configuration: {missing_fields}")
+            logger.info("Missing required configuration: %s", missing_fields)
             return None
 
         placeholders = ['YOUR_AREA_HERE', 'YOUR_SUBSTATION_HERE', 'YOUR_FEEDER_HERE', 'YOUR_METER_NO']
         for key, value in config.items():
             if value in placeholders:
-                logger.info(f"Placeholder value found: {key} = {value}")
+                logger.info("Placeholder value found: %s = %s", key, value)
                 return None
 
+        save_cached_configuration(config_file, mtime, config)
         logger.info("LV Monthly Power Factor Detailed Configuration loaded successfully")
         return config
     except Exception as e:
-        logger.info(f"Error reading configuration file: {e}")
+        logger.info("Error reading configuration file: %s", e)
         return None
 
 
@@ -244,10 +305,10 @@ def validate_config_at_startup():
 
     config_file = "user_config.xlsx"
     if not os.path.exists(config_file):
-        logger.info(f"Configuration file not found: {config_file}")
+        logger.info("Configuration file not found: %s", config_file)
         logger.info("Creating default LV Monthly Power Factor Detailed configuration template...")
         if create_default_config_file(config_file):
-            logger.info(f"Created: {config_file}")
+            logger.info("Created: %s", config_file)
             logger.info("Please edit the configuration file and restart")
         return None
 
@@ -257,13 +318,13 @@ def validate_config_at_startup():
         return None
 
     logger.info("LV Monthly Power Factor Detailed Configuration validated successfully")
-    logger.info(f"   Monitoring Type: LV Monthly Power Factor Detailed View")
-    logger.info(f"   Area: {config['area']}")
-    logger.info(f"   Substation: {config['substation']}")
-    logger.info(f"   Feeder: {config['feeder']}")
-    logger.info(f"   Month: {config['target_month_year']}")
-    logger.info(f"   Meter: {config['meter_serial_no']}")
-    logger.info(f"   Meter Type: {config['meter_type']}")
+    logger.info("   Monitoring Type: LV Monthly Power Factor Detailed View")
+    logger.info("   Area: %s", config['area'])
+    logger.info("   Substation: %s", config['substation'])
+    logger.info("   Feeder: %s", config['feeder'])
+    logger.info("   Month: %s", config['target_month_year'])
+    logger.info("   Meter: %s", config['meter_serial_no'])
+    logger.info("   Meter Type: %s", config['meter_type'])
     return config
 
 
@@ -276,139 +337,260 @@ def log_execution_time(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
-        logger.info(f"Starting {func.__name__}...")
+        logger.info("Starting %s...", func.__name__)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"{func.__name__} completed in {time.time() - start_time:.2f}s")
+            logger.info("%s completed in %.2fs", func.__name__, time.time() - start_time)
             return result
         except Exception as e:
-            logger.info(f"{func.__name__} failed: {e}")
+            logger.info("%s failed: %s", func.__name__, e)
             raise
 
     return wrapper
 
 
+# ============================================================================
+# DATABASE CONNECTION POOL
+# ============================================================================
+_DB_POOLS = {}
+_DB_POOL_LOCK = threading.Lock()
+
+# Schema names cannot be bound parameters, so the tenant is checked before it is formatted into SQL
+TENANT_NAME_PATTERN = re.compile(r'tenant\d{2}')
+
+# Meter details and SIP duration in one round-trip - prepared once per DB1 connection, run with EXECUTE
+METER_LOOKUP_STATEMENTS = {'DT': 'pf_meter_lookup_dt', 'LV': 'pf_meter_lookup_lv'}
+METER_LOOKUP_TEMPLATE = """
+    PREPARE {statement} AS
+    SELECT d.dt_id, d.{name_column} AS dt_name, d.meterid, m.sip
+    FROM {tenant}.{network_table} d
+    LEFT JOIN LATERAL (
+        SELECT sip FROM {tenant}.tb_metermasterdetail WHERE mtrid = d.meterid LIMIT 1
+    ) m ON TRUE
+    WHERE d.meter_serial_no = $1
+    LIMIT 1
+"""
+
+# Power factor readings for one meter and month range - meter and dates are bound parameters
+RAW_PF_QUERY_TEMPLATE = """
+    SELECT surveydate, pf
+    FROM {tenant}.tb_raw_loadsurveydata
+    WHERE mtrid = %s AND surveydate >= %s AND surveydate < %s
+    ORDER BY surveydate ASC
+"""
+
+
+def tenant_schema():
+    """Return the configured tenant schema, refusing anything that is not a plain tenantNN name"""
+    tenant = DatabaseConfig.TENANT_NAME
+    if not TENANT_NAME_PATTERN.fullmatch(tenant):
+        raise ValueError(f"Invalid tenant name: {tenant!r}")
+    return tenant
+
+
+def meter_lookup_statements():
+    """PREPARE statements for the DT and LV meter lookups"""
+    tenant = tenant_schema()
+    return (
+        METER_LOOKUP_TEMPLATE.format(statement=METER_LOOKUP_STATEMENTS['DT'], tenant=tenant,
+                                     name_column='dt_name', network_table='tb_ntw_dt'),
+        METER_LOOKUP_TEMPLATE.format(statement=METER_LOOKUP_STATEMENTS['LV'], tenant=tenant,
+                                     name_column='lvfeeder_name', network_table='tb_ntw_lvfeeder'),
+    )
+
+
+class PreparedStatementPool(ThreadedConnectionPool):
+    """ThreadedConnectionPool that runs PREPARE statements on every new connection"""
+
+    def __init__(self, minconn, maxconn, prepared_statements=(), **kwargs):
+        self.prepared_statements = prepared_statements  # Must exist before the base class opens minconn
+        super().__init__(minconn, maxconn, **kwargs)
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        if self.prepared_statements:
+            with conn.cursor() as cursor:
+                for statement in self.prepared_statements:
+                    cursor.execute(statement)
+            conn.commit()
+        return conn
+
+
+def get_db_pool(db_name):
+    """Return the shared connection pool for 'db1' or 'db2', creating it on first use"""
+    with _DB_POOL_LOCK:
+        pool = _DB_POOLS.get(db_name)
+        if pool is None:
+            if db_name == 'db1':
+                pool = PreparedStatementPool(minconn=1, maxconn=4, prepared_statements=meter_lookup_statements(),
+                                             **DatabaseConfig.get_db1_params())
+            else:
+                pool = ThreadedConnectionPool(minconn=1, maxconn=4, **DatabaseConfig.get_db2_params())
+            _DB_POOLS[db_name] = pool
+        return pool
+
+
+@contextmanager
+def db_conn(db_name):
+    """Borrow a pooled connection and always hand it back to the pool"""
+    pool = get_db_pool(db_name)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def close_db_pools():
+    """Close every pooled connection (registered to run at interpreter exit)"""
+    with _DB_POOL_LOCK:
+        for pool in _DB_POOLS.values():
+            pool.closeall()
+        _DB_POOLS.clear()
+
+
+atexit.register(close_db_pools)
+
+
+def read_sql_copy(conn, query, params=None, dtype=None):
+    """Stream a SELECT through COPY ... TO STDOUT as CSV and parse it with pandas"""
+    buffer = io.StringIO()
+    with conn.cursor() as cursor:
+        if params is not None:
+            # COPY does not accept bind parameters - let psycopg2 quote them client-side
+            query = cursor.mogrify(query, params).decode()
+        cursor.copy_expert(f"COPY ({query.strip().rstrip(';')}) TO STDOUT WITH CSV HEADER", buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, parse_dates=['surveydate'], dtype=dtype)
+
+
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
 @log_execution_time
 def get_metrics(mtr_serial_no, meter_type):
     """Get meter metrics from database"""
-    logger.info(f"Fetching LV Monthly Power Factor Detailed metrics for meter: {mtr_serial_no}")
+    logger.info("Fetching LV Monthly Power Factor Detailed metrics for meter: %s", mtr_serial_no)
     try:
-        conn = psycopg2.connect(**DatabaseConfig.get_db1_params())
-        cursor = conn.cursor()
-
-        if meter_type.upper() == 'DT':
-            query1 = f"SELECT dt_id, dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_dt WHERE meter_serial_no = %s LIMIT 1;"
-        elif meter_type.upper() == 'LV':
-            query1 = f"SELECT dt_id, lvfeeder_name AS dt_name, meterid FROM {DatabaseConfig.TENANT_NAME}.tb_ntw_lvfeeder WHERE meter_serial_no = %s LIMIT 1;"
-        else:
-            logger.info(f"Invalid meter type: {meter_type}")
+        statement = METER_LOOKUP_STATEMENTS.get(meter_type.upper())
+        if statement is None:
+            logger.info("Invalid meter type: %s", meter_type)
             return None, None, None, None
 
-        cursor.execute(query1, (mtr_serial_no,))
-        result1 = cursor.fetchone()
-        if not result1:
-            logger.info(f"Meter not found: {mtr_serial_no}")
-            return None, None, None, None
-
-        dt_id, dt_name, meterid = result1
+        with db_conn('db1') as conn, conn.cursor() as cursor:
+            # Plan was cached by PREPARE when the pooled connection was opened
+            cursor.execute(f"EXECUTE {statement} (%s)", (mtr_serial_no,))
+            result = cursor.fetchone()
+            if not result:
+                logger.info("Meter not found: %s", mtr_serial_no)
+                return None, None, None, None
 
-        # Get SIP duration
-        query2 = f"SELECT sip FROM {DatabaseConfig.TENANT_NAME}.tb_metermasterdetail WHERE mtrid = %s LIMIT 1;"
-        cursor.execute(query2, (meterid,))
-        result2 = cursor.fetchone()
-        sip_duration = int(result2[0]) if result2 and result2[0] else 15
+            dt_id, dt_name, meterid, sip = result
+            sip_duration = int(sip) if sip else 15
 
-        logger.info(f"Metrics: {dt_name}, meterid: {meterid}, SIP: {sip_duration}min")
-        return dt_id, dt_name, meterid, sip_duration
+            logger.info("Metrics: %s, meterid: %s, SIP: %smin", dt_name, meterid, sip_duration)
+            return dt_id, dt_name, meterid, sip_duration
     except Exception as e:
-        logger.info(f"Database error: {e}")
+        logger.info("Database error: %s", e)
         return None, None, None, None
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 
 @log_execution_time
 def get_database_data_for_monthly_detailed(month_info, mtr_id):
     """Fetch database data for complete month detailed view - POWER FACTOR PARAMETERS"""
-    logger.info(f"Fetching monthly detailed database data for: {month_info['selected_month_year']}")
+    logger.info("Fetching monthly detailed database data for: %s", month_info['selected_month_year'])
 
-    start_date = month_info['start_date'].strftime("%Y-%m-%d")
-    end_date_next = (month_info['end_date'] + timedelta(days=1)).strftime("%Y-%m-%d")
-    date_filter = f"AND surveydate >= '{start_date}' AND surveydate < '{end_date_next}'"
+    start_date = month_info['start_date']
+    end_date_next = month_info['end_date'] + timedelta(days=1)
 
     try:
-        conn = psycopg2.connect(**DatabaseConfig.get_db2_params())
+        with db_conn('db2') as conn:
+            # Query for POWER FACTOR parameters from RAW data - only the columns the calculations read,
+            # with the meter and month range as bound parameters (COPY cannot wrap EXECUTE, so this one is not prepared)
+            raw_query = RAW_PF_QUERY_TEMPLATE.format(tenant=tenant_schema())
 
-        # Query for POWER FACTOR parameters from RAW data
-        raw_query = f"""
-            SELECT surveydate, pf, avg_i
-            FROM {DatabaseConfig.TENANT_NAME}.tb_raw_loadsurveydata 
-            WHERE mtrid={mtr_id} {date_filter}
-            ORDER BY surveydate ASC;
-        """
+            # COPY streams the month as CSV and pandas' C parser builds the columns - no per-row
+            # Python tuples and no dtype inference for pf
+            raw_df = read_sql_copy(conn, raw_query, (mtr_id, start_date, end_date_next), dtype={'pf': 'float64'})
 
-        raw_df = pd.read_sql(raw_query, conn)
-
-        logger.info(f"Retrieved: Raw={len(raw_df)} power factor records")
+        logger.info("Retrieved: Raw=%s power factor records", len(raw_df))
         return raw_df
     except Exception as e:
-        logger.info(f"Database error: {e}")
+        logger.info("Database error: %s", e)
         return pd.DataFrame()
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 
 # ============================================================================
 # WEB AUTOMATION FUNCTIONS
 # ============================================================================
+def _wait(driver, t=10):
+    """Shared WebDriverWait factory - one default timeout and a 0.2s poll for the whole flow"""
+    return WebDriverWait(driver, t, poll_frequency=0.2)
+
+
 def login(driver):
     """Login to web application"""
     try:
         logger.info("Logging in...")
         driver.get("https://networkmonitoringpv.secure.online:10122/")
-        time.sleep(1)
-        driver.find_element(By.ID, "UserName").send_keys("SANYAM")
+        wait = _wait(driver, 15)
+        wait.until(EC.presence_of_element_located((By.ID, "UserName"))).send_keys("SANYAM")
         driver.find_element(By.ID, "Password").send_keys("Sanyam@1234")
-        time.sleep(10)
-        driver.find_element(By.ID, "btnlogin").click()
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//span[@class='dx-button-text' and text()='Continue']").click()
-        time.sleep(5)
+        wait.until(EC.element_to_be_clickable((By.ID, "btnlogin"))).click()
+        wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//span[@class='dx-button-text' and text()='Continue']"))).click()
         logger.info("Login successful")
         return True
     except Exception as e:
-        logger.info(f"Login failed: {e}")
+        logger.info("Login failed: %s", e)
         return False
 
 
+XPATH_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+XPATH_LOWER = XPATH_UPPER.lower()
+
+
+def xpath_literal(value):
+    """Quote a string for use inside an XPath expression (XPath 1.0 has no escape character)"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
 def select_dropdown_option(driver, dropdown_id, option_name):
     """Select dropdown option"""
     try:
-        logger.info(f"Selecting {option_name} in {dropdown_id}")
+        logger.info("Selecting %s in %s", option_name, dropdown_id)
         dropdown = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.ID, dropdown_id)))
         dropdown.click()
         WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".dx-list-item")))
-        options = driver.find_elements(By.CSS_SELECTOR, ".dx-list-item")
-        for option in options:
-            if option.text.strip().lower() == option_name.lower():
-                option.click()
-                logger.info(f"Selected: {option_name}")
-                return True
-        logger.info(f"Option not found: {option_name}")
+        # Let the browser match the item text (case-insensitive) instead of reading every item's .text
+        options = driver.find_elements(By.XPATH, (
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' dx-list-item ')"
+            f" and translate(normalize-space(.), '{XPATH_UPPER}', '{XPATH_LOWER}') = {xpath_literal(option_name.lower())}]"
+        ))
+        # Items of dropdowns closed earlier stay in the DOM hidden - only the open list's items can be clicked
+        option = next((o for o in options if o.is_displayed()), None)
+        if option is not None:
+            option.click()
+            logger.info("Selected: %s", option_name)
+            return True
+        logger.info("Option not found: %s", option_name)
         return False
     except Exception as e:
-        logger.info(f"Dropdown error: {e}")
+        logger.info("Dropdown error: %s", e)
         return False
 
 
+# Full month name (any case, as strptime's %B accepted) -> month number
+MONTH_NUMBERS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
+
+
 def set_calendar_month(driver, target_month_year):
     """Set calendar to target month and return month info"""
-    logger.info(f"Setting calendar to month: {target_month_year}")
+    logger.info("Setting calendar to month: %s", target_month_year)
     try:
         driver.find_element(By.XPATH, "//span[@class='dx-button-text' and text()='Month']").click()
         time.sleep(1)
@@ -419,14 +601,11 @@ def set_calendar_month(driver, target_month_year):
         driver.find_element(By.XPATH, '//div[@id="dxSearchbtn"]').click()
 
         month_name, year = target_month_year.split()
-        month_num = datetime.strptime(month_name, "%B").month
+        month_num = MONTH_NUMBERS[month_name.lower()]
         year = int(year)
 
-        start_date = datetime(year, month_num, 1).date()
-        if month_num == 12:
-            end_date = datetime(year + 1, 1, 1).date() - pd.Timedelta(days=1)
-        else:
-            end_date = datetime(year, month_num + 1, 1).date() - pd.Timedelta(days=1)
+        start_date = date(year, month_num, 1)
+        end_date = date(year, month_num, calendar.monthrange(year, month_num)[1])
 
         month_info = {
             'selected_month_year': target_month_year,
@@ -437,10 +616,10 @@ def set_calendar_month(driver, target_month_year):
         }
 
         logger.info("Month set successfully")
-        logger.info(f"Complete month range: {start_date} to {end_date}")
+        logger.info("Complete month range: %s to %s", start_date, end_date)
         return month_info
     except Exception as e:
-        logger.info(f"Month setting error: {e}")
+        logger.info("Month setting error: %s", e)
         return None
 
 
@@ -448,20 +627,20 @@ def select_type(driver):
     """Select LV monitoring - FIXED FOR LV ONLY"""
     try:
         logger.info("Selecting LV monitoring (fixed for LV monthly power factor detailed script)")
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//A[@id='divHome']").click()
-        time.sleep(5)
-        driver.find_element(By.XPATH, "//A[@id='divlvmonitoring']").click()
+        wait = _wait(driver, 15)
+        wait.until(EC.element_to_be_clickable((By.XPATH, "//A[@id='divHome']"))).click()
+        wait.until(EC.element_to_be_clickable((By.XPATH, "//A[@id='divlvmonitoring']"))).click()
         logger.info("LV monitoring selected")
-        time.sleep(3)
+        # Area dropdown is the next element touched
+        wait.until(EC.element_to_be_clickable((By.ID, "ddl-area")))
     except Exception as e:
-        logger.info(f"Type selection error: {e}")
+        logger.info("Type selection error: %s", e)
 
 
 def select_meter_type(driver, meter_type):
     """Select meter type - DT or LV only"""
     try:
-        logger.info(f"Selecting meter type: {meter_type}")
+        logger.info("Selecting meter type: %s", meter_type)
         wait = WebDriverWait(driver, 10)
 
         if meter_type == "DT":
@@ -479,14 +658,14 @@ def select_meter_type(driver, meter_type):
         time.sleep(3)
         return True
     except Exception as e:
-        logger.info(f"Meter type error: {e}")
+        logger.info("Meter type error: %s", e)
         return False
 
 
 @log_execution_time
 def find_and_click_view_using_search(driver, wait, meter_serial_no):
     """Find meter using search box and click View"""
-    logger.info(f"Searching for meter: {meter_serial_no}")
+    logger.info("Searching for meter: %s", meter_serial_no)
     try:
         search_input = wait.until(EC.presence_of_element_located(
             (By.XPATH, "//input[@placeholder='Search grid' and @aria-label='Search in the data grid']")))
@@ -504,13 +683,13 @@ def find_and_click_view_using_search(driver, wait, meter_serial_no):
             logger.info("View clicked (1 result)")
             return True
 
-        logger.info(f"Found {len(view_buttons)} results, finding exact match")
+        logger.info("Found %s results, finding exact match", len(view_buttons))
         for idx, view_btn in enumerate(view_buttons):
             try:
                 parent_row = view_btn.find_element(By.XPATH, "./ancestor::tr")
                 if meter_serial_no in parent_row.text:
                     view_btn.click()
-                    logger.info(f"View clicked (exact match at row {idx + 1})")
+                    logger.info("View clicked (exact match at row %s)", idx + 1)
                     return True
             except:
                 continue
@@ -519,10 +698,26 @@ def find_and_click_view_using_search(driver, wait, meter_serial_no):
         logger.info("View clicked (first result)")
         return True
     except Exception as e:
-        logger.info(f"Search error: {e}")
+        logger.info("Search error: %s", e)
         return False
 
 
+def wait_for_tooltip_text(driver, tooltip_selector, previous_text, timeout=1):
+    """Poll until the chart tooltip shows text other than the previous bar's; on timeout return
+    whatever it shows (two bars can legitimately share a value)"""
+    def changed_text(d):
+        try:
+            text = d.find_element(By.CSS_SELECTOR, tooltip_selector).text.strip()
+        except Exception:
+            return False
+        return text if text and text != previous_text else False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(changed_text)
+    except TimeoutException:
+        return driver.find_element(By.CSS_SELECTOR, tooltip_selector).text.strip()
+
+
 @log_execution_time
 def collect_side_panel_pf_data(driver, wait):
     """Collect power factor data from detailed view side panel"""
@@ -544,7 +739,7 @@ def collect_side_panel_pf_data(driver, wait):
         try:
             pf_avg = driver.find_element(By.XPATH, "//span[@id='avgPf']").text
         except Exception as e:
-            logger.debug(f"Error fetching PF average: {e}")
+            logger.debug("Error fetching PF average: %s", e)
             pf_avg = '-'
 
         # Power Factor Duration bars
@@ -563,6 +758,8 @@ def collect_side_panel_pf_data(driver, wait):
             '#86B8A5': 'Duration PF > 0.95'
         }
 
+        tooltip_text = ''
+        bar_errors = []  # (bar number, error) - logged once after the hover loop
         for i, bar in enumerate(pf_pattern_bars):
             try:
                 fill_color = bar.get_attribute('fill')
@@ -570,14 +767,14 @@ def collect_side_panel_pf_data(driver, wait):
 
                 if label:
                     action.move_to_element(bar).perform()
-                    time.sleep(1)
-
-                    tooltip = driver.find_element(By.CSS_SELECTOR, tooltip_selector)
-                    tooltip_text = tooltip.text.strip()
+                    tooltip_text = wait_for_tooltip_text(driver, tooltip_selector, tooltip_text)
                     pf_durations[label] = tooltip_text
 
             except Exception as e:
-                logger.debug(f"Error processing PF bar {i + 1}: {e}")
+                bar_errors.append((i + 1, str(e)))
+
+        if bar_errors:
+            logger.debug("Errors processing %d PF bar(s): %s", len(bar_errors), bar_errors[:10])
 
         data = {
             'Power Factor Average': pf_avg,
@@ -586,253 +783,278 @@ def collect_side_panel_pf_data(driver, wait):
 
         logger.info("Power factor side panel data collected successfully")
     except Exception as e:
-        logger.error(f"Error collecting power factor side panel data: {str(e)}")
+        logger.error("Error collecting power factor side panel data: %s", str(e))
         raise
 
     return data
 
 
+def write_table_workbook(file_name, sheets):
+    """Write {sheet title: rows} as plain tables - a write-only workbook streams each prepared
+    row straight to the file instead of building a cell model"""
+    wb = Workbook(write_only=True)
+    for title, rows in sheets.items():
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    wb.save(file_name)
+
+
 @log_execution_time
 def save_side_panel_data_to_excel(side_data, month_info, sip_duration):
     """Save side panel power factor data to Excel"""
     logger.info("Saving side panel power factor data to Excel...")
 
     try:
-        wb = Workbook()
-        wb.remove(wb.active)
-
-        # Power Factor Table Sheet
-        ws_pf = wb.create_sheet("Power Factor Table")
-        ws_pf.append(["Parameter", "UI_Value"])
-        for key, value in side_data.items():
-            ws_pf.append([key, value])
-
-        # SIP Configuration Sheet
-        ws_sip = wb.create_sheet("SIP Configuration")
-        ws_sip.append(["Parameter", "Value"])
-        ws_sip.append(["SIP Duration (minutes)", sip_duration])
-        ws_sip.append(["Expected SIPs per day", (24 * 60) // sip_duration])
-        ws_sip.append(["Month Analyzed", month_info['selected_month_year']])
+        sheets = {
+            "Power Factor Table": [["Parameter", "UI_Value"], *side_data.items()],
+            "SIP Configuration": [
+                ["Parameter", "Value"],
+                ["SIP Duration (minutes)", sip_duration],
+                ["Expected SIPs per day", (24 * 60) // sip_duration],
+                ["Month Analyzed", month_info['selected_month_year']],
+            ],
+        }
 
         # Save
         file_name = f"ui_side_panel_pf_data_monthly_detailed_{month_info['selected_month_year'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
-        wb.save(file_name)
-        logger.info(f"Side panel power factor data saved: {file_name}")
+        write_table_workbook(file_name, sheets)
+        logger.info("Side panel power factor data saved: %s", file_name)
         return file_name
 
     except Exception as e:
-        logger.error(f"Error saving side panel data: {str(e)}")
+        logger.error("Error saving side panel data: %s", str(e))
         raise
 
 
 # ============================================================================
 # DATABASE PROCESSING FOR POWER FACTOR
 # ============================================================================
-def format_duration(hours_val):
-    """Format hours as HH:MM string"""
-    if hours_val == '-' or pd.isna(hours_val):
-        return '-'
+# Right-side searchsorted edges: 0.95 itself must land in the middle band, so the upper edge
+# is the next float above it
+PF_BAND_EDGES = np.array([0.9, np.nextafter(0.95, np.inf)])
 
-    try:
-        total_minutes = int(hours_val * 60)
-        hrs = total_minutes // 60
-        mins = total_minutes % 60
-        return f"{hrs:02d}:{mins:02d} hrs"
-    except:
-        return '-'
+
+def format_durations(sip_counts, sip_duration):
+    """Format SIP counts as HH:MM duration strings ('-' for none) - minutes stay integers throughout"""
+    sip_counts = np.asarray(sip_counts, dtype=np.int64)
+    hrs, mins = np.divmod(sip_counts * sip_duration, 60)
+    return [f"{h:02d}:{m:02d} hrs" if count else '-'
+            for count, h, m in zip(sip_counts.tolist(), hrs.tolist(), mins.tolist())]
 
 
 @log_execution_time
 def calculate_side_panel_pf_metrics_from_raw_data(raw_df, month_info, sip_duration):
     """Calculate side panel power factor metrics from RAW data using dynamic SIP duration"""
-    logger.info(f"Calculating side panel power factor metrics from RAW data with {sip_duration}-minute SIP intervals...")
+    logger.info("Calculating side panel power factor metrics from RAW data with %s-minute SIP intervals...", sip_duration)
 
     month_year_safe = month_info['selected_month_year'].replace(' ', '_').replace('/', '_')
     timestamp = datetime.now().strftime('%Y%m%d_%H%M')
 
-    logger.info(f"Processing RAW power factor data: {len(raw_df)} records with {sip_duration}-minute intervals")
+    logger.info("Processing RAW power factor data: %s records with %s-minute intervals", len(raw_df), sip_duration)
 
-    df_raw = raw_df.copy()
-    df_raw['surveydate'] = pd.to_datetime(df_raw['surveydate'])
+    # Only pf is read - work on its values directly rather than on a copy of the whole frame
+    pf_all = raw_df['pf'].to_numpy(dtype=np.float64, na_value=np.nan)
 
     # Filter valid power factor values (0 to 0.999999)
-    valid_pf_mask = (df_raw['pf'] >= 0) & (df_raw['pf'] <= 0.999999)
-    pf_series = df_raw.loc[valid_pf_mask, 'pf']
+    pf_values = pf_all[(pf_all >= 0) & (pf_all <= 0.999999)]
 
-    logger.info(f"Using dynamic SIP duration: {sip_duration} minutes for all power factor calculations")
-    logger.info(f"Valid PF records: {len(pf_series)} out of {len(df_raw)}")
+    logger.info("Using dynamic SIP duration: %s minutes for all power factor calculations", sip_duration)
+    logger.info("Valid PF records: %s out of %s", pf_values.size, len(raw_df))
 
     # Calculate Power Factor Average
-    pf_avg = pf_series.mean() if len(pf_series) > 0 else 0
+    pf_avg = pf_values.mean() if pf_values.size > 0 else 0
 
-    # Calculate durations based on SIP intervals
-    def calc_duration(pf_values):
-        count = len(pf_values)
-        if count == 0:
-            return '-'
-        total_minutes = count * sip_duration
-        hours = total_minutes / 60
-        return hours
+    # Bucket every value in one pass: 0 = PF < 0.9, 1 = 0.9 <= PF <= 0.95, 2 = PF > 0.95
+    pf_band_counts = np.bincount(np.searchsorted(PF_BAND_EDGES, pf_values, side='right'), minlength=3)
+    count_lt_09, count_between_09_095, count_gt_095 = (int(count) for count in pf_band_counts)
 
-    duration_gt_095 = calc_duration(pf_series[pf_series > 0.95])
-    duration_between_09_095 = calc_duration(pf_series[(pf_series >= 0.9) & (pf_series <= 0.95)])
-    duration_lt_09 = calc_duration(pf_series[pf_series < 0.9])
+    # Calculate durations based on SIP intervals - all three bands formatted from the same counts
+    duration_lt_09, duration_between_09_095, duration_gt_095 = format_durations(pf_band_counts, sip_duration)
 
     # Create calculated side panel data structure
     calculated_data = {
         'Power Factor Average': f"{pf_avg:.4f}" if pf_avg > 0 else '-',
-        'Duration PF < 0.9': format_duration(duration_lt_09),
-        'Duration PF 0.9 - 0.95': format_duration(duration_between_09_095),
-        'Duration PF > 0.95': format_duration(duration_gt_095)
+        'Duration PF < 0.9': duration_lt_09,
+        'Duration PF 0.9 - 0.95': duration_between_09_095,
+        'Duration PF > 0.95': duration_gt_095
     }
 
     # Save calculated data to Excel
     calculated_file = f"calculated_side_panel_pf_data_{month_year_safe}_{timestamp}.xlsx"
-    wb = Workbook()
-    wb.remove(wb.active)
-
-    # Power Factor Table Sheet
-    ws_pf = wb.create_sheet('Power Factor Table')
-    ws_pf.append(['Parameter', 'Calculated_Value'])
-    for key, value in calculated_data.items():
-        ws_pf.append([key, value])
-
-    # SIP Configuration Sheet
-    ws_sip = wb.create_sheet('SIP Configuration')
-    ws_sip.append(['Parameter', 'Value'])
-    ws_sip.append(['SIP Duration (minutes)', sip_duration])
-    ws_sip.append(['Expected SIPs per day', (24 * 60) // sip_duration])
-    ws_sip.append(['Actual SIPs', len(raw_df)])
-    ws_sip.append(['Valid PF SIPs', len(pf_series)])
-    ws_sip.append(['Power Factor Average', f"{pf_avg:.4f}"])
-    ws_sip.append(['PF < 0.9 Count', len(pf_series[pf_series < 0.9])])
-    ws_sip.append(['PF 0.9-0.95 Count', len(pf_series[(pf_series >= 0.9) & (pf_series <= 0.95)])])
-    ws_sip.append(['PF > 0.95 Count', len(pf_series[pf_series > 0.95])])
-
-    wb.save(calculated_file)
-
-    logger.info(f"Side panel power factor metrics calculation completed using {sip_duration}-minute SIP intervals")
-    logger.info(f"Power Factor Average: {pf_avg:.4f}")
+    write_table_workbook(calculated_file, {
+        'Power Factor Table': [['Parameter', 'Calculated_Value'], *calculated_data.items()],
+        'SIP Configuration': [
+            ['Parameter', 'Value'],
+            ['SIP Duration (minutes)', sip_duration],
+            ['Expected SIPs per day', (24 * 60) // sip_duration],
+            ['Actual SIPs', len(raw_df)],
+            ['Valid PF SIPs', pf_values.size],
+            ['Power Factor Average', f"{pf_avg:.4f}"],
+            ['PF < 0.9 Count', count_lt_09],
+            ['PF 0.9-0.95 Count', count_between_09_095],
+            ['PF > 0.95 Count', count_gt_095],
+        ],
+    })
+
+    logger.info("Side panel power factor metrics calculation completed using %s-minute SIP intervals", sip_duration)
+    logger.info("Power Factor Average: %.4f", pf_avg)
     return calculated_data, calculated_file
 
 
 # ============================================================================
 # COMPARISON AND VALIDATION
 # ============================================================================
-@log_execution_time
-def create_detailed_comparison(ui_file, calculated_file, month_info, sip_duration):
-    """Create complete monthly detailed power factor comparison with validation"""
-    logger.info("Creating monthly detailed power factor comparison...")
+_NUM_RE = re.compile(r'([-+]?\d*\.?\d+)')
+PF_AVERAGE_TOLERANCE = 0.001  # Power factor average
+PF_DURATION_TOLERANCE = 1.0  # Durations (minutes tolerance)
+# Per-sheet validation outcome: compared parameter names and a parallel bool array of matches
+SheetResult = namedtuple('SheetResult', 'items matches')
+
+# Validation fills are immutable style values - build them once instead of on every comparison
+_GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+_RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+
+
+def first_numbers(values):
+    """First number in each value as float64 - numeric values are taken as-is, text is searched
+    with _NUM_RE, NaN where there is none"""
+    numbers = np.full(len(values), np.nan)
+    text_positions, texts = [], []
+    for i, value in enumerate(values):
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            numbers[i] = value
+        else:
+            text_positions.append(i)
+            texts.append(str(value))
+    if texts:
+        numbers[text_positions] = pd.Series(texts, dtype=object).str.extract(_NUM_RE, expand=False).astype(np.float64)
+    return numbers
 
-    try:
-        month_safe = month_info['selected_month_year'].replace(' ', '_').replace('/', '_')
-        output_file = f"complete_validation_report_monthly_pf_detailed_{month_safe}.xlsx"
 
-        # Load sheets
-        ui_data = pd.read_excel(ui_file, sheet_name='Power Factor Table')
-        calculated_data = pd.read_excel(calculated_file, sheet_name='Power Factor Table')
+def normalized_strings(values):
+    """Values as text with all spaces removed and lowercased for fair string comparison -
+    None and NaN become empty strings"""
+    text = pd.Series(values, dtype=object).map(str).str.lower()
+    return text.mask(text.isin(['nan', 'none']), '').str.replace(' ', '', regex=False).str.strip().to_numpy()
 
-        # Colors
-        green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
 
-        wb = Workbook()
-        wb.remove(wb.active)
+def compare_pf_numbers(ui_numbers, calc_numbers, is_average):
+    """Element-wise tolerance check - a NaN on either side (no number found) never matches"""
+    tolerances = np.where(is_average, PF_AVERAGE_TOLERANCE, PF_DURATION_TOLERANCE)
+    return np.abs(ui_numbers - calc_numbers) <= tolerances
 
-        validation_results = {}
 
-        def normalize_string(s):
-            """Remove all spaces and lowercase for fair string comparison"""
-            if s is None or str(s).lower() in ['nan', 'none']:
-                return ""
-            return str(s).replace(" ", "").strip().lower()
+@log_execution_time
+def create_detailed_comparison(ui_data, calculated_data, month_info, sip_duration):
+    """Create complete monthly detailed power factor comparison with validation - compares the
+    {parameter: value} tables already in memory instead of reading the saved workbooks back"""
+    logger.info("Creating monthly detailed power factor comparison...")
 
-        logger.info(f"Creating comparison for Power Factor Table")
+    try:
+        month_safe = month_info['selected_month_year'].replace(' ', '_').replace('/', '_')
 
-        ws = wb.create_sheet(title="Power_Factor_Table_Comparison")
+        # UI values line up with calculated parameters by position, as in the saved Power Factor Tables
+        params = list(calculated_data)
+        calc_values = list(calculated_data.values())
+        ui_values = list(ui_data.values())[:len(params)]
+        ui_values += ["-"] * (len(params) - len(ui_values))
 
-        headers = ["Parameter", "UI_Value", "Calculated_Value", "Match", "Notes"]
-        ws.append(headers)
+        # Both checks run over every parameter up front - None/NaN/'-' values simply come out as
+        # no number and an empty string, so no row needs its own error handling
+        string_matches = normalized_strings(ui_values) == normalized_strings(calc_values)
+        is_average = pd.Series(params, dtype=object).astype(str).str.lower().str.contains('average', regex=False)
+        numeric_matches = compare_pf_numbers(first_numbers(ui_values), first_numbers(calc_values),
+                                             is_average.to_numpy(dtype=bool))
 
-        sheet_results = []
+        validation_results = {}
 
-        for i in range(len(calculated_data)):
-            try:
-                param = calculated_data.iloc[i, 0]
-                calc_val = calculated_data.iloc[i, 1]
-                ui_val = ui_data.iloc[i, 1] if i < len(ui_data) else "-"
-
-                ui_str = normalize_string(ui_val)
-                calc_str = normalize_string(calc_val)
-
-                # Try numeric comparison first
-                numeric_match = False
-                try:
-                    if calc_val is not None and ui_val is not None:
-                        ui_num_match = re.search(r'[-+]?(\d*\.?\d+)', str(ui_val))
-                        calc_num_match = re.search(r'[-+]?(\d*\.?\d+)', str(calc_val))
-
-                        if ui_num_match and calc_num_match:
-                            ui_num = float(ui_num_match.group())
-                            calc_num = float(calc_num_match.group())
-                            # Tolerance based on parameter type
-                            if 'average' in str(param).lower():
-                                tolerance = 0.001  # Power factor average
-                            else:
-                                tolerance = 1.0  # Duration (minutes tolerance)
-                            numeric_match = abs(ui_num - calc_num) <= tolerance
-                except (ValueError, TypeError, AttributeError):
-                    numeric_match = False
-
-                # Overall match determination
-                if numeric_match:
-                    match = 'YES'
-                    match_color = green_fill
-                    notes = f'Numeric values match (SIP: {sip_duration}min)'
-                elif ui_str == calc_str:
-                    match = 'YES'
-                    match_color = green_fill
-                    notes = f'String values match (SIP: {sip_duration}min)'
-                else:
-                    match = 'NO'
-                    match_color = red_fill
-                    notes = f'Values differ (SIP: {sip_duration}min)'
-
-                sheet_results.append({
-                    'item': param,
-                    'match': match == 'YES'
-                })
-
-                row_data = [param, ui_val, calc_val, match, notes]
-                ws.append(row_data)
-
-                # Apply color to match column
-                match_cell = ws.cell(row=ws.max_row, column=4)
-                match_cell.fill = match_color
+        logger.info("Creating comparison for Power Factor Table")
+
+        comparison_rows = []
+
+        for param, calc_val, ui_val, numeric_match, string_match in zip(
+                params, calc_values, ui_values, numeric_matches.tolist(), string_matches.tolist()):
+            # Overall match determination - numeric first, then normalized strings
+            if numeric_match:
+                match = 'YES'
+                match_color = _GREEN_FILL
+                notes = f'Numeric values match (SIP: {sip_duration}min)'
+            elif string_match:
+                match = 'YES'
+                match_color = _GREEN_FILL
+                notes = f'String values match (SIP: {sip_duration}min)'
+            else:
+                match = 'NO'
+                match_color = _RED_FILL
+                notes = f'Values differ (SIP: {sip_duration}min)'
 
-            except Exception as e:
-                logger.warning(f"Error processing row {i} in Power Factor Table: {str(e)}")
-                continue
+            comparison_rows.append((param, ui_val, calc_val, match, match_color, notes))
 
-        validation_results['Power Factor Table'] = sheet_results
+        sheet_result = SheetResult(params, numeric_matches | string_matches)
+        validation_results['Power Factor Table'] = sheet_result
 
-        passed_count = sum(1 for result in sheet_results if result['match'])
-        failed_count = len(sheet_results) - passed_count
-        logger.info(f"Power Factor Table Validation: {passed_count} passed, {failed_count} failed")
+        passed_count = int(np.count_nonzero(sheet_result.matches))
+        failed_count = len(sheet_result.matches) - passed_count
+        logger.info("Power Factor Table Validation: %s passed, %s failed", passed_count, failed_count)
 
+        output_file = f"complete_validation_report_monthly_pf_detailed_{month_safe}.xlsx"
+        wb = Workbook(write_only=True)  # No default sheet to remove; rows are streamed in order
+        ws = wb.create_sheet(title="Power_Factor_Table_Comparison")
+        ws.append(["Parameter", "UI_Value", "Calculated_Value", "Match", "Notes"])
+        for param, ui_val, calc_val, match, match_color, notes in comparison_rows:
+            # Color the match column as the row is written
+            match_cell = WriteOnlyCell(ws, value=match)
+            match_cell.fill = match_color
+            ws.append([param, ui_val, calc_val, match_cell, notes])
         wb.save(output_file)
-        logger.info(f"Monthly detailed power factor comparison saved: {output_file}")
+        logger.info("Monthly detailed power factor comparison saved: %s", output_file)
 
         return output_file, validation_results
 
     except Exception as e:
-        logger.error(f"Error creating monthly detailed power factor comparison: {str(e)}")
+        logger.error("Error creating monthly detailed power factor comparison: %s", str(e))
         raise
 
 
 # ============================================================================
 # SUMMARY REPORT
 # ============================================================================
+# Summary report styles - built once at import; label/data/status cells that look alike share one object
+_CENTER = Alignment(horizontal="center", vertical="center")
+_LEFT = Alignment(horizontal="left", vertical="center")
+_MAIN_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_MAIN_HEADER_FONT = Font(bold=True, size=14, color="FFFFFF", name="Calibri")
+_MAIN_HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+_SECTION_FONT = Font(bold=True, size=11, color="FFFFFF", name="Calibri")
+_SECTION_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_TIMESTAMP_FONT = Font(size=10, italic=True, color="666666", name="Calibri")
+_TIMESTAMP_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+_DATA_FONT = Font(size=10, name="Calibri", color="000000")
+_BOLD_FONT = Font(bold=True, size=10, name="Calibri", color="000000")  # labels, rates, warnings
+_STATUS_FONT = Font(bold=True, size=10, color="FFFFFF", name="Calibri")  # on PASS/FAIL fills
+_SUCCESS_RATE_FONT = Font(bold=True, size=11, name="Calibri", color="000000")
+_WHITE_FILL = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
+_GREY_FILL = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+_PASS_FILL = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+_FAIL_FILL = PatternFill(start_color="C55A5A", end_color="C55A5A", fill_type="solid")
+_WARNING_FILL = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+_THICK_SIDE = Side(style='medium', color='000000')
+_THIN_SIDE = Side(style='thin', color='000000')
+_THICK_BORDER = Border(left=_THICK_SIDE, right=_THICK_SIDE, top=_THICK_SIDE, bottom=_THICK_SIDE)
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+# (font, fill, alignment) per kind of table cell
+_LABEL_STYLE = (_BOLD_FONT, _GREY_FILL, _LEFT)
+_DATA_STYLE = (_DATA_FONT, _WHITE_FILL, _LEFT)
+_DATA_CENTER_STYLE = (_DATA_FONT, _WHITE_FILL, _CENTER)
+_RATE_STYLE = (_BOLD_FONT, _WHITE_FILL, _CENTER)
+_PASS_STYLE = (_STATUS_FONT, _PASS_FILL, _CENTER)
+_FAIL_STYLE = (_STATUS_FONT, _FAIL_FILL, _CENTER)
+# Widths of summary columns A..H; the full-width rows span all of them
+_SUMMARY_COL_WIDTHS = (30, 25, 20, 25, 15, 15, 15, 15)
+_SUMMARY_NCOLS = len(_SUMMARY_COL_WIDTHS)
+
+
 @log_execution_time
 def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
                                    comparison_file, validation_results, raw_df, meter_name, sip_duration):
@@ -848,55 +1070,37 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws = wb.active
         ws.title = "Validation_Summary_Report"
 
-        # Enhanced Styles
-        main_header_font = Font(bold=True, size=14, color="FFFFFF", name="Calibri")
-        main_header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        main_header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        section_header_font = Font(bold=True, size=11, color="FFFFFF", name="Calibri")
-        section_header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        section_header_alignment = Alignment(horizontal="left", vertical="center")
-
-        label_font = Font(bold=True, size=10, name="Calibri", color="000000")
-        label_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        label_alignment = Alignment(horizontal="left", vertical="center")
-
-        data_font = Font(size=10, name="Calibri", color="000000")
-        data_fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
-        data_alignment = Alignment(horizontal="left", vertical="center")
-
-        pass_font = Font(bold=True, size=10, color="FFFFFF", name="Calibri")
-        pass_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        pass_alignment = Alignment(horizontal="center", vertical="center")
-
-        fail_font = Font(bold=True, size=10, color="FFFFFF", name="Calibri")
-        fail_fill = PatternFill(start_color="C55A5A", end_color="C55A5A", fill_type="solid")
-        fail_alignment = Alignment(horizontal="center", vertical="center")
-
-        thick_border = Border(
-            left=Side(style='medium', color='000000'),
-            right=Side(style='medium', color='000000'),
-            top=Side(style='medium', color='000000'),
-            bottom=Side(style='medium', color='000000')
-        )
-
-        thin_border = Border(
-            left=Side(style='thin', color='000000'),
-            right=Side(style='thin', color='000000'),
-            top=Side(style='thin', color='000000'),
-            bottom=Side(style='thin', color='000000')
-        )
-
         current_row = 1
 
+        def append_styled_row(values, styles, height=20):
+            """Append one row in a single call, then style its cells by integer index - each entry of
+            styles is a (font, fill, alignment) triple; every cell gets the thin border"""
+            nonlocal current_row
+            ws.append(values)
+            row = ws.max_row
+            for col_idx, (font, fill, alignment) in enumerate(styles, start=1):
+                cell = ws.cell(row=row, column=col_idx)
+                cell.font = font
+                cell.fill = fill
+                cell.alignment = alignment
+                cell.border = _THIN_BORDER
+            ws.row_dimensions[row].height = height
+            current_row = row + 1
+
+        def border_covered_cells(span, border):
+            """Border the cells a merge at current_row covers - the top-left cell is styled directly,
+            but Excel draws the merged range's outer edges from the covered cells"""
+            for col_idx in range(2, span + 1):
+                ws.cell(row=current_row, column=col_idx).border = border
+
         # ============ MAIN HEADER ============
         ws.merge_cells(f'A{current_row}:H{current_row}')
         header_cell = ws[f'A{current_row}']
         header_cell.value = f"LV MONTHLY POWER FACTOR DETAILED VIEW VALIDATION SUMMARY - {month_info['selected_month_year'].upper()}"
-        header_cell.font = main_header_font
-        header_cell.fill = main_header_fill
-        header_cell.alignment = main_header_alignment
-        header_cell.border = thick_border
+        header_cell.font = _MAIN_HEADER_FONT
+        header_cell.fill = _MAIN_HEADER_FILL
+        header_cell.alignment = _MAIN_HEADER_ALIGNMENT
+        header_cell.border = _THICK_BORDER
         ws.row_dimensions[current_row].height = 30
         current_row += 1
 
@@ -904,10 +1108,10 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:H{current_row}')
         timestamp_cell = ws[f'A{current_row}']
         timestamp_cell.value = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        timestamp_cell.font = Font(size=10, italic=True, color="666666", name="Calibri")
-        timestamp_cell.alignment = Alignment(horizontal="center", vertical="center")
-        timestamp_cell.fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        timestamp_cell.border = thin_border
+        timestamp_cell.font = _TIMESTAMP_FONT
+        timestamp_cell.alignment = _CENTER
+        timestamp_cell.fill = _TIMESTAMP_FILL
+        timestamp_cell.border = _THIN_BORDER
         ws.row_dimensions[current_row].height = 20
         current_row += 1
 
@@ -918,12 +1122,11 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:B{current_row}')
         section_cell = ws[f'A{current_row}']
         section_cell.value = "📋 TEST DETAILS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B']:
-            ws[f'{col}{current_row}'].border = thick_border
+        section_cell.font = _SECTION_FONT
+        section_cell.fill = _SECTION_FILL
+        section_cell.alignment = _LEFT
+        section_cell.border = _THICK_BORDER
+        border_covered_cells(2, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 25
         current_row += 1
 
@@ -936,20 +1139,7 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ]
 
         for label, value in test_details:
-            ws[f'A{current_row}'].value = label
-            ws[f'A{current_row}'].font = label_font
-            ws[f'A{current_row}'].fill = label_fill
-            ws[f'A{current_row}'].alignment = label_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = value
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = data_alignment
-            ws[f'B{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
+            append_styled_row([label, value], (_LABEL_STYLE, _DATA_STYLE))
 
         current_row += 1
 
@@ -957,12 +1147,11 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:B{current_row}')
         section_cell = ws[f'A{current_row}']
         section_cell.value = "🔧 SYSTEM UNDER TEST"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B']:
-            ws[f'{col}{current_row}'].border = thick_border
+        section_cell.font = _SECTION_FONT
+        section_cell.fill = _SECTION_FILL
+        section_cell.alignment = _LEFT
+        section_cell.border = _THICK_BORDER
+        border_covered_cells(2, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 25
         current_row += 1
 
@@ -980,20 +1169,7 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ]
 
         for label, value in system_details:
-            ws[f'A{current_row}'].value = label
-            ws[f'A{current_row}'].font = label_font
-            ws[f'A{current_row}'].fill = label_fill
-            ws[f'A{current_row}'].alignment = label_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = value
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = data_alignment
-            ws[f'B{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
+            append_styled_row([label, value], (_LABEL_STYLE, _DATA_STYLE))
 
         current_row += 1
 
@@ -1001,25 +1177,23 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:C{current_row}')
         section_cell = ws[f'A{current_row}']
         section_cell.value = "📊 DATA VOLUME ANALYSIS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C']:
-            ws[f'{col}{current_row}'].border = thick_border
+        section_cell.font = _SECTION_FONT
+        section_cell.fill = _SECTION_FILL
+        section_cell.alignment = _LEFT
+        section_cell.border = _THICK_BORDER
+        border_covered_cells(3, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 25
         current_row += 1
 
         # Column headers
         headers = ["Dataset", "Record Count", "Status"]
         for i, header in enumerate(headers, start=1):
-            col_letter = chr(64 + i)
-            cell = ws[f'{col_letter}{current_row}']
+            cell = ws.cell(row=current_row, column=i)
             cell.value = header
-            cell.font = label_font
-            cell.fill = label_fill
-            cell.alignment = label_alignment
-            cell.border = thin_border
+            cell.font = _BOLD_FONT
+            cell.fill = _GREY_FILL
+            cell.alignment = _LEFT
+            cell.border = _THIN_BORDER
         ws.row_dimensions[current_row].height = 22
         current_row += 1
 
@@ -1028,9 +1202,9 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         expected_records = days_in_month * ((24 * 60) // sip_duration)
         data_completeness = (len(raw_df) / expected_records * 100) if expected_records > 0 else 0
 
-        # Calculate valid PF records
-        valid_pf_mask = (raw_df['pf'] >= 0) & (raw_df['pf'] <= 0.999999)
-        valid_pf_count = valid_pf_mask.sum()
+        # Calculate valid PF records - both bounds checked on the raw float64 values and counted at C level
+        pf_all = raw_df['pf'].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid_pf_count = int(np.count_nonzero((pf_all >= 0) & (pf_all <= 0.999999)))
 
         data_rows = [
             ["Raw Database Records", len(raw_df), "COMPLETE RECORDS" if len(raw_df) > 0 else "NO DATA"],
@@ -1040,34 +1214,10 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ]
 
         for dataset, count, status in data_rows:
-            ws[f'A{current_row}'].value = dataset
-            ws[f'A{current_row}'].font = data_font
-            ws[f'A{current_row}'].fill = data_fill
-            ws[f'A{current_row}'].alignment = data_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = count
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'B{current_row}'].border = thin_border
-
-            ws[f'C{current_row}'].value = status
-            if "COMPLETE" in str(status) or "%" in str(status) or "DYNAMIC" in str(status):
-                if data_completeness >= 90 or "COMPLETE RECORDS" in str(status) or "DYNAMIC" in str(status) or "Valid" in str(status):
-                    ws[f'C{current_row}'].font = pass_font
-                    ws[f'C{current_row}'].fill = pass_fill
-                else:
-                    ws[f'C{current_row}'].font = fail_font
-                    ws[f'C{current_row}'].fill = fail_fill
-            else:
-                ws[f'C{current_row}'].font = fail_font
-                ws[f'C{current_row}'].fill = fail_fill
-            ws[f'C{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'C{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
+            status_ok = ("COMPLETE" in str(status) or "%" in str(status) or "DYNAMIC" in str(status)) and (
+                data_completeness >= 90 or "COMPLETE RECORDS" in str(status) or "DYNAMIC" in str(status) or "Valid" in str(status))
+            append_styled_row([dataset, count, status],
+                              (_DATA_STYLE, _DATA_CENTER_STYLE, _PASS_STYLE if status_ok else _FAIL_STYLE))
 
         current_row += 1
 
@@ -1075,25 +1225,23 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:E{current_row}')
         section_cell = ws[f'A{current_row}']
         section_cell.value = "✅ VALIDATION RESULTS"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws[f'{col}{current_row}'].border = thick_border
+        section_cell.font = _SECTION_FONT
+        section_cell.fill = _SECTION_FILL
+        section_cell.alignment = _LEFT
+        section_cell.border = _THICK_BORDER
+        border_covered_cells(5, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 25
         current_row += 1
 
         # Column headers
         validation_headers = ["Comparison Type", "Matches", "Mismatches", "Success Rate", "Status"]
         for i, header in enumerate(validation_headers, start=1):
-            col_letter = chr(64 + i)
-            cell = ws[f'{col_letter}{current_row}']
+            cell = ws.cell(row=current_row, column=i)
             cell.value = header
-            cell.font = label_font
-            cell.fill = label_fill
-            cell.alignment = label_alignment
-            cell.border = thin_border
+            cell.font = _BOLD_FONT
+            cell.fill = _GREY_FILL
+            cell.alignment = _LEFT
+            cell.border = _THIN_BORDER
         ws.row_dimensions[current_row].height = 22
         current_row += 1
 
@@ -1103,8 +1251,8 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         validation_data = []
 
         for sheet_name, results in validation_results.items():
-            total_items = len(results)
-            passed_items = sum(1 for result in results if result['match'])
+            total_items = len(results.matches)
+            passed_items = int(np.count_nonzero(results.matches))
             failed_items = total_items - passed_items
             success_rate = f"{(passed_items / total_items) * 100:.1f}%" if total_items > 0 else "0%"
             status = "PASS" if passed_items == total_items else "FAIL"
@@ -1116,42 +1264,9 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
             overall_total += total_items
 
         for comp_type, matches, mismatches, rate, status in validation_data:
-            ws[f'A{current_row}'].value = comp_type
-            ws[f'A{current_row}'].font = data_font
-            ws[f'A{current_row}'].fill = data_fill
-            ws[f'A{current_row}'].alignment = data_alignment
-            ws[f'A{current_row}'].border = thin_border
-
-            ws[f'B{current_row}'].value = matches
-            ws[f'B{current_row}'].font = data_font
-            ws[f'B{current_row}'].fill = data_fill
-            ws[f'B{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'B{current_row}'].border = thin_border
-
-            ws[f'C{current_row}'].value = mismatches
-            ws[f'C{current_row}'].font = data_font
-            ws[f'C{current_row}'].fill = data_fill
-            ws[f'C{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'C{current_row}'].border = thin_border
-
-            ws[f'D{current_row}'].value = rate
-            ws[f'D{current_row}'].font = Font(bold=True, size=10, name="Calibri", color="000000")
-            ws[f'D{current_row}'].fill = data_fill
-            ws[f'D{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'D{current_row}'].border = thin_border
-
-            ws[f'E{current_row}'].value = status
-            if status == "PASS":
-                ws[f'E{current_row}'].font = pass_font
-                ws[f'E{current_row}'].fill = pass_fill
-            else:
-                ws[f'E{current_row}'].font = fail_font
-                ws[f'E{current_row}'].fill = fail_fill
-            ws[f'E{current_row}'].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f'E{current_row}'].border = thin_border
-
-            ws.row_dimensions[current_row].height = 20
-            current_row += 1
+            append_styled_row([comp_type, matches, mismatches, rate, status],
+                              (_DATA_STYLE, _DATA_CENTER_STYLE, _DATA_CENTER_STYLE, _RATE_STYLE,
+                               _PASS_STYLE if status == "PASS" else _FAIL_STYLE))
 
         current_row += 1
 
@@ -1159,12 +1274,11 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:H{current_row}')
         section_cell = ws[f'A{current_row}']
         section_cell.value = "🏆 OVERALL ASSESSMENT"
-        section_cell.font = section_header_font
-        section_cell.fill = section_header_fill
-        section_cell.alignment = section_header_alignment
-        section_cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thick_border
+        section_cell.font = _SECTION_FONT
+        section_cell.fill = _SECTION_FILL
+        section_cell.alignment = _LEFT
+        section_cell.border = _THICK_BORDER
+        border_covered_cells(_SUMMARY_NCOLS, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 25
         current_row += 1
 
@@ -1172,26 +1286,25 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
 
         if overall_success_rate >= 95:
             assessment = "✓ EXCELLENT: Monthly detailed power factor validation passed with high confidence"
-            assessment_color = pass_fill
-            assessment_font_color = pass_font
+            assessment_color = _PASS_FILL
+            assessment_font_color = _STATUS_FONT
         elif overall_success_rate >= 80:
             assessment = "⚠ GOOD: Minor discrepancies found - Review recommended"
-            assessment_color = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-            assessment_font_color = Font(bold=True, size=10, color="000000", name="Calibri")
+            assessment_color = _WARNING_FILL
+            assessment_font_color = _BOLD_FONT
         else:
             assessment = "❌ REQUIRES ATTENTION: Significant validation failures detected"
-            assessment_color = fail_fill
-            assessment_font_color = fail_font
+            assessment_color = _FAIL_FILL
+            assessment_font_color = _STATUS_FONT
 
         ws.merge_cells(f'A{current_row}:H{current_row}')
         cell = ws[f'A{current_row}']
         cell.value = assessment
         cell.font = assessment_font_color
         cell.fill = assessment_color
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thick_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thick_border
+        cell.alignment = _CENTER
+        cell.border = _THICK_BORDER
+        border_covered_cells(_SUMMARY_NCOLS, _THICK_BORDER)
         ws.row_dimensions[current_row].height = 30
         current_row += 1
 
@@ -1199,39 +1312,37 @@ def create_detailed_summary_report(config, month_info, ui_file, calculated_file,
         ws.merge_cells(f'A{current_row}:H{current_row}')
         cell = ws[f'A{current_row}']
         cell.value = f"Overall Success Rate: {overall_success_rate:.1f}% ({overall_passed}/{overall_total} validations passed)"
-        cell.font = Font(bold=True, size=11, name="Calibri", color="000000")
-        cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thin_border
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}{current_row}'].border = thin_border
+        cell.font = _SUCCESS_RATE_FONT
+        cell.fill = _GREY_FILL
+        cell.alignment = _CENTER
+        cell.border = _THIN_BORDER
+        border_covered_cells(_SUMMARY_NCOLS, _THIN_BORDER)
         ws.row_dimensions[current_row].height = 22
         current_row += 1
 
         # Set column widths
-        column_widths = {'A': 30, 'B': 25, 'C': 20, 'D': 25, 'E': 15, 'F': 15, 'G': 15, 'H': 15}
-        for col_letter, width in column_widths.items():
-            ws.column_dimensions[col_letter].width = width
+        for col_idx, width in enumerate(_SUMMARY_COL_WIDTHS, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
 
         wb.save(summary_file)
-        logger.info(f"Enhanced monthly detailed power factor summary report created: {summary_file}")
+        logger.info("Enhanced monthly detailed power factor summary report created: %s", summary_file)
 
         # Log summary
         logger.info("=" * 60)
         logger.info("MONTHLY DETAILED POWER FACTOR VALIDATION SUMMARY")
         logger.info("=" * 60)
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
-        logger.info(f"Month: {month_info['selected_month_year']}")
-        logger.info(f"SIP Duration: {sip_duration} minutes")
-        logger.info(f"Data: Raw={len(raw_df)} records")
-        logger.info(f"Overall Success Rate: {overall_success_rate:.1f}%")
-        logger.info(f"Data Completeness: {data_completeness:.1f}%")
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
+        logger.info("Month: %s", month_info['selected_month_year'])
+        logger.info("SIP Duration: %s minutes", sip_duration)
+        logger.info("Data: Raw=%s records", len(raw_df))
+        logger.info("Overall Success Rate: %.1f%%", overall_success_rate)
+        logger.info("Data Completeness: %.1f%%", data_completeness)
         logger.info("=" * 60)
 
         return summary_file
 
     except Exception as e:
-        logger.error(f"Error creating summary report: {str(e)}")
+        logger.error("Error creating summary report: %s", str(e))
         raise
 
 
@@ -1259,10 +1370,10 @@ def main_lv_monthly_pf_detailed_automation():
         logger.info("=" * 60)
         logger.info("DATABASE CONFIGURATION")
         logger.info("=" * 60)
-        logger.info(f"DB1: {DatabaseConfig.DB1_HOST}:{DatabaseConfig.DB1_PORT}/{DatabaseConfig.DB1_DATABASE}")
-        logger.info(f"DB2: {DatabaseConfig.DB2_HOST}:{DatabaseConfig.DB2_PORT}/{DatabaseConfig.DB2_DATABASE}")
-        logger.info(f"Tenant: {DatabaseConfig.TENANT_NAME}")
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
+        logger.info("DB1: %s:%s/%s", DatabaseConfig.DB1_HOST, DatabaseConfig.DB1_PORT, DatabaseConfig.DB1_DATABASE)
+        logger.info("DB2: %s:%s/%s", DatabaseConfig.DB2_HOST, DatabaseConfig.DB2_PORT, DatabaseConfig.DB2_DATABASE)
+        logger.info("Tenant: %s", DatabaseConfig.TENANT_NAME)
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
         logger.info("=" * 60)
 
         # Start browser
@@ -1299,10 +1410,10 @@ def main_lv_monthly_pf_detailed_automation():
         dt_id, name, mtr_id, sip_duration = get_metrics(config['meter_serial_no'], config['meter_type'])
 
         if not dt_id:
-            logger.info(f"Meter not found: {config['meter_serial_no']}")
+            logger.info("Meter not found: %s", config['meter_serial_no'])
             return False
 
-        logger.info(f"Meter found: {name} (ID: {mtr_id}, SIP: {sip_duration}min)")
+        logger.info("Meter found: %s (ID: %s, SIP: %smin)", name, mtr_id, sip_duration)
 
         # Find and click View
         time.sleep(3)
@@ -1338,7 +1449,7 @@ def main_lv_monthly_pf_detailed_automation():
         # Create comparison report
         logger.info("Creating validation comparison...")
         comparison_file, validation_results = create_detailed_comparison(
-            ui_file, calculated_file, month_info, sip_duration)
+            side_panel_data, calculated_data, month_info, sip_duration)
         comparison_file = save_file_to_output(comparison_file, output_folder)
 
         # Create summary report
@@ -1353,23 +1464,23 @@ def main_lv_monthly_pf_detailed_automation():
         logger.info("=" * 60)
         logger.info("LV MONTHLY POWER FACTOR DETAILED AUTOMATION COMPLETED SUCCESSFULLY!")
         logger.info("=" * 60)
-        logger.info(f"Test Engineer: {TestEngineer.NAME}")
-        logger.info(f"Monitoring Type: LV Monthly Power Factor Detailed View")
-        logger.info(f"Output Folder: {output_folder}")
-        logger.info(f"Month: {config['target_month_year']}")
-        logger.info(f"Area: {config['area']}")
-        logger.info(f"Substation: {config['substation']}")
-        logger.info(f"Feeder: {config['feeder']}")
-        logger.info(f"Meter: {config['meter_serial_no']} ({name})")
-        logger.info(f"Meter Type: {config['meter_type']}")
-        logger.info(f"SIP Duration: {sip_duration} minutes (dynamic from DB)")
-        logger.info(f"Database Records: {len(raw_df)} records")
+        logger.info("Test Engineer: %s", TestEngineer.NAME)
+        logger.info("Monitoring Type: LV Monthly Power Factor Detailed View")
+        logger.info("Output Folder: %s", output_folder)
+        logger.info("Month: %s", config['target_month_year'])
+        logger.info("Area: %s", config['area'])
+        logger.info("Substation: %s", config['substation'])
+        logger.info("Feeder: %s", config['feeder'])
+        logger.info("Meter: %s (%s)", config['meter_serial_no'], name)
+        logger.info("Meter Type: %s", config['meter_type'])
+        logger.info("SIP Duration: %s minutes (dynamic from DB)", sip_duration)
+        logger.info("Database Records: %s records", len(raw_df))
         logger.info("")
         logger.info("Generated Files (4 total):")
-        logger.info(f"   1. {os.path.basename(ui_file) if ui_file else 'UI side panel data'}")
-        logger.info(f"   2. {os.path.basename(calculated_file) if calculated_file else 'Calculated data'}")
-        logger.info(f"   3. {os.path.basename(comparison_file) if comparison_file else 'Comparison report'}")
-        logger.info(f"   4. {os.path.basename(summary_report) if summary_report else 'Summary report'}")
+        logger.info("   1. %s", os.path.basename(ui_file) if ui_file else 'UI side panel data')
+        logger.info("   2. %s", os.path.basename(calculated_file) if calculated_file else 'Calculated data')
+        logger.info("   3. %s", os.path.basename(comparison_file) if comparison_file else 'Comparison report')
+        logger.info("   4. %s", os.path.basename(summary_report) if summary_report else 'Summary report')
         logger.info("")
         logger.info("KEY FEATURES APPLIED:")
         logger.info("   ✓ LV Monthly Power Factor Detailed View monitoring")
@@ -1386,7 +1497,7 @@ def main_lv_monthly_pf_detailed_automation():
         return True
 
     except Exception as e:
-        logger.info(f"Critical error: {e}")
+        logger.info("Critical error: %s", e)
 
         if output_folder and os.path.exists(output_folder):
             try:
@@ -1397,7 +1508,7 @@ def main_lv_monthly_pf_detailed_automation():
                     f.write(f"Error: {str(e)}\n")
                     f.write(f"Config: {config}\n")
                     f.write(f"Engineer: {TestEngineer.NAME}\n")
-                logger.info(f"Error log saved: {os.path.basename(error_file)}")
+                logger.info("Error log saved: %s", os.path.basename(error_file))
             except:
                 pass
 
@@ -1419,9 +1530,9 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("LV MONTHLY POWER FACTOR DETAILED VIEW AUTOMATION")
     logger.info("=" * 60)
-    logger.info(f"Test Engineer: {TestEngineer.NAME}")
-    logger.info(f"Monitoring Type: LV Monthly Power Factor Detailed View")
-    logger.info(f"Database Tenant: {DatabaseConfig.TENANT_NAME}")
+    logger.info("Test Engineer: %s", TestEngineer.NAME)
+    logger.info("Monitoring Type: LV Monthly Power Factor Detailed View")
+    logger.info("Database Tenant: %s", DatabaseConfig.TENANT_NAME)
     logger.info("")
     logger.info("FEATURES:")
     logger.info("   ✓ LV Monthly Power Factor Detailed View monitoring")
@@ -1443,7 +1554,7 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     if success:
         logger.info("LV MONTHLY POWER FACTOR DETAILED AUTOMATION COMPLETED SUCCESSFULLY ✓")
-        logger.info(f"Total Time: {total_time:.2f}s ({total_time / 60:.1f}min)")
+        logger.info("Total Time: %.2fs (%.1fmin)", total_time, total_time / 60)
         logger.info("All optimizations verified:")
         logger.info("   ✓ LV Monthly Power Factor Detailed View monitoring")
         logger.info("   ✓ Complete month processing")
@@ -1456,7 +1567,7 @@ if __name__ == "__main__":
         logger.info("   ✓ All 4 output files generated")
     else:
         logger.info("LV MONTHLY POWER FACTOR DETAILED AUTOMATION FAILED ✗")
-        logger.info(f"Failed after: {total_time:.2f}s ({total_time / 60:.1f}min)")
+        logger.info("Failed after: %.2fs (%.1fmin)", total_time, total_time / 60)
         logger.info("Check error logs in output folder")
 
     logger.info("=" * 60)